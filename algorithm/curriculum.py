@@ -1,12 +1,16 @@
 """课程生成算法 - 纯算法逻辑"""
 import os
-import json
 import time
 import re
-from typing import Dict, Optional
+from collections import deque
+from typing import Dict, List, Optional
 from interface.executor import IExecutor
 from interface.llm import ILLM
 from interface.storage import IStorage
+from utils import fast_json
+
+# 预编译的 action 名称提取正则
+_ACTION_RE = re.compile(r"\(:action\s+([^\s)]+)")
 
 
 class CurriculumAlgorithm:
@@ -15,15 +19,20 @@ class CurriculumAlgorithm:
     纯算法逻辑，只依赖接口
     """
 
-    def __init__(self, llm: ILLM, storage: IStorage):
+    def __init__(self, llm: ILLM, storage: IStorage, models: Optional[List[str]] = None):
         """
         初始化课程算法
 
         :param llm: LLM客户端
         :param storage: 存储接口
+        :param models: 按重试次数依次使用的模型列表（如先用轻量模型，失败后换主模型），
+                       次数超出列表长度时沿用最后一个；为None时始终使用客户端默认模型
         """
         self.llm = llm
         self.storage = storage
+        self.models = models
+        # (domain内容, action列表)：domain未变化时直接复用上次的提取结果
+        self._learned_actions_cache = None
 
     def propose_next_task(self, executor: IExecutor) -> Optional[Dict]:
         """
@@ -156,32 +165,55 @@ class CurriculumAlgorithm:
         if not os.path.exists(storage_path):
             return "当前存储空间 (storage) 为空。"
 
-        for root, dirs, files in os.walk(storage_path):
-            rel_path = os.path.relpath(root, storage_path)
-            logic_path = "root" if rel_path == "." else rel_path
-            safe_files = [f.replace(".", "_dot_") for f in files]
+        # 使用 os.scandir 按层遍历：目录项类型直接取自 dirent，无需逐项 stat
+        pending = deque([(storage_path, "")])
+        while pending:
+            current, rel_path = pending.popleft()
+            dirs, safe_files = [], []
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.name)
+                        elif entry.is_file(follow_symlinks=False):
+                            safe_files.append(entry.name.replace(".", "_dot_"))
+            except OSError:
+                continue
+
+            logic_path = rel_path or "root"
             snapshot.append(f"- 目录 [{logic_path}] 包含文件夹: {dirs}, 包含文件: {safe_files}")
 
+            for name in dirs:
+                child_rel = f"{rel_path}{os.sep}{name}" if rel_path else name
+                pending.append((os.path.join(current, name), child_rel))
+
         return "\n".join(snapshot)
 
     def _extract_learned_actions(self, domain_content: str) -> list:
         """从PDDL文本中提取所有已存在的action名称"""
-        actions = re.findall(r"\(:action\s+([^\s\)]+)", domain_content)
-        return actions
+        cached = self._learned_actions_cache
+        if cached is not None and cached[0] == domain_content:
+            return list(cached[1])
+
+        actions = _ACTION_RE.findall(domain_content)
+        self._learned_actions_cache = (domain_content, actions)
+        return list(actions)
 
     def _call_llm_with_retry(self, prompt: str, max_retries: int = 3) -> Optional[Dict]:
         """调用LLM并重试"""
         for attempt in range(max_retries):
+            model = self.models[min(attempt, len(self.models) - 1)] if self.models else None
             try:
                 response = self.llm.chat(
                     messages=[
                         {"role": "system", "content": "你只输出 JSON 格式的任务定义。"},
                         {"role": "user", "content": prompt}
                     ],
-                    response_format={'type': 'json_object'}
+                    response_format={'type': 'json_object'},
+                    model=model
                 )
 
-                task_data = json.loads(response)
+                task_data = fast_json.loads(response)
                 print(f"\n[Curriculum] 教官出题成功: {task_data['goal']}")
                 return task_data
             except Exception as e:
@@ -10,6 +10,7 @@ from interface.storage import IStorage
 from interface.translator import ITranslator
 from config.settings import Settings
 from config.constants import CONSTANTS
+from utils import fast_json
 
 
 class EvolutionAlgorithm:
@@ -72,7 +73,8 @@ class EvolutionAlgorithm:
             # 每次尝试开始时：设置沙盒技能目录和存储路径环境变量
             import os
             sandbox_skills_dir = os.path.join(sandbox_manager.get_sandbox_path(), "skills")
-            os.makedirs(sandbox_skills_dir, exist_ok=True)
+            if not os.path.isdir(sandbox_skills_dir):
+                os.makedirs(sandbox_skills_dir, exist_ok=True)
             os.environ["SANDBOX_MCP_SKILLS_DIR"] = sandbox_skills_dir
             
             # 设置沙盒存储路径环境变量（用于MCP技能的文件操作隔离）
@@ -105,10 +107,12 @@ class EvolutionAlgorithm:
                 self.executor.clear_execution_history()
 
                 # 执行setup动作（只允许基础技能）
-                base_skills = CONSTANTS.BASE_SKILLS
-                for action in task_data.get('setup_actions', []):
-                    if action[0] in base_skills:
-                        self.executor.execute(" ".join(action))
+                base_skills = CONSTANTS.BASE_SKILL_SET
+                self.executor.execute_batch([
+                    " ".join(action)
+                    for action in task_data.get('setup_actions', [])
+                    if action[0] in base_skills
+                ])
 
                 # 注意：这里不清空历史，让翻译器能看到setup动作（特别是scan）
                 # 审计时会通过history_before_validation来区分setup动作和验证动作
@@ -327,8 +331,7 @@ MCP技能必须返回结构化响应，使用 self.create_success_response(messa
         if "```json" in content:
             content = content.replace("```json", "").replace("```", "")
 
-        import json
-        return json.loads(content)
+        return fast_json.loads(content)
 
     def _generate_final_report(self, goal: str):
         """生成失败总结报告"""
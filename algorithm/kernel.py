@@ -1,5 +1,6 @@
 """AxiomLabs核心内核算法"""
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Set, Dict, Optional
 from interface.translator import ITranslator
 from interface.planner import IPlanner
@@ -8,6 +9,14 @@ from interface.storage import IStorage
 from config.settings import Settings
 from config.constants import CONSTANTS
 
+# Problem PDDL 各段落的正则（模块级预编译，每轮迭代直接复用）
+_GOAL_AND_RE = re.compile(r'\(:goal\s+\(and\s+(.*?)\s*\)\s*\)', re.DOTALL)
+_GOAL_RE = re.compile(r'\(:goal\s+(.*?)\s*\)', re.DOTALL)
+_PREDICATE_RE = re.compile(r'\(.*?\)')
+_OBJECTS_RE = re.compile(r'\(:objects\s+(.*?)\s*\)', re.DOTALL)
+_INIT_BEFORE_GOAL_RE = re.compile(r'\(:init\s+(.*?)\s*\)\s*\(:goal', re.DOTALL)
+_INIT_TO_END_RE = re.compile(r'\(:init\s+(.*?)\s*\)\s*\)', re.DOTALL)
+
 
 class AxiomLabsKernel:
     """
@@ -59,9 +68,24 @@ class AxiomLabsKernel:
         :return: 是否成功
         """
         # 1. 路由领域
+        domain_content = None
         if not self.current_domain:
-            self.current_domain = self.translator.route_domain(user_goal)
+            # 路由请求在后台等待LLM响应，同时预读默认领域的Domain（绝大多数任务会路由到该领域）
+            speculative_domain = self.config.domain_name
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                route_future = pool.submit(self.translator.route_domain, user_goal)
+                try:
+                    prefetched = self._load_domain_content(speculative_domain)
+                except OSError:
+                    prefetched = None
+                self.current_domain = route_future.result()
             print(f"[Kernel] 领域路由成功: [{self.current_domain}]")
+            if self.current_domain == speculative_domain:
+                domain_content = prefetched
+
+        # 读取domain内容（任务执行期间domain不会变化，只读取一次）
+        if domain_content is None:
+            domain_content = self._load_domain_content(self.current_domain)
 
         # 2. 迭代执行
         for i in range(self.max_iterations):
@@ -97,20 +121,6 @@ class AxiomLabsKernel:
             # 4. 保存Problem并执行规划
             self.storage.write_problem(problem_pddl)
             
-            # 读取domain内容
-            if self.sandbox_mode and self.domain_path:
-                # 沙盒模式：从指定路径读取domain_exp.pddl
-                import os
-                if os.path.exists(self.domain_path):
-                    with open(self.domain_path, "r", encoding="utf-8") as f:
-                        domain_content = f.read()
-                else:
-                    # 回退到默认domain
-                    domain_content = self.storage.read_domain(self.current_domain)
-            else:
-                # 正常模式：从storage读取domain.pddl
-                domain_content = self.storage.read_domain(self.current_domain)
-
             plan_result = self.planner.plan(domain_content, problem_pddl)
 
             if not plan_result.success:
@@ -163,6 +173,22 @@ class AxiomLabsKernel:
         print(f"[Kernel] 达到最大迭代次数，任务未完成")
         return False
 
+    def _load_domain_content(self, domain: str) -> str:
+        """
+        读取任务使用的Domain内容
+
+        :param domain: 领域名称
+        :return: Domain PDDL内容
+        """
+        if self.sandbox_mode and self.domain_path:
+            # 沙盒模式：从指定路径读取domain_exp.pddl
+            import os
+            if os.path.exists(self.domain_path):
+                with open(self.domain_path, "r", encoding="utf-8") as f:
+                    return f.read()
+        # 正常模式（或沙盒domain缺失时回退）：从storage读取domain.pddl
+        return self.storage.read_domain(domain)
+
     def _extract_goal_predicates(self, problem_pddl: str) -> list:
         """
         从PDDL Problem中提取目标谓词
@@ -170,13 +196,13 @@ class AxiomLabsKernel:
         :param problem_pddl: Problem PDDL内容
         :return: 谓词列表
         """
-        goal_match = re.search(r'\(:goal\s+\(and\s+(.*?)\s*\)\s*\)', problem_pddl, re.DOTALL)
+        goal_match = _GOAL_AND_RE.search(problem_pddl)
         if not goal_match:
-            goal_match = re.search(r'\(:goal\s+(.*?)\s*\)', problem_pddl, re.DOTALL)
+            goal_match = _GOAL_RE.search(problem_pddl)
 
         if goal_match:
             goal_content = goal_match.group(1).strip()
-            predicates = re.findall(r'\(.*?\)', goal_content)
+            predicates = _PREDICATE_RE.findall(goal_content)
             return [p.strip() for p in predicates]
 
         return []
@@ -199,7 +225,7 @@ class AxiomLabsKernel:
         同时提取第一轮的init事实作为base_init_facts
         """
         # 正则匹配objects部分
-        objects_match = re.search(r'\(:objects\s+(.*?)\s*\)', problem_pddl, re.DOTALL)
+        objects_match = _OBJECTS_RE.search(problem_pddl)
         if not objects_match:
             return
         objects_text = objects_match.group(1).strip()
@@ -218,13 +244,10 @@ class AxiomLabsKernel:
         print(f"[Kernel] 从第一轮problem中提取objects: {self.objects}")
         
         # 提取init部分作为基础事实
-        init_match = re.search(r'\(:init\s+(.*?)\s*\)\s*\(:goal', problem_pddl, re.DOTALL)
-        if not init_match:
-            # 尝试另一种模式：init后面直接是goal
-            init_match = re.search(r'\(:init\s+(.*?)\s*\)\s*\(:goal', problem_pddl, re.DOTALL)
+        init_match = _INIT_BEFORE_GOAL_RE.search(problem_pddl)
         if not init_match:
             # 最后尝试：init到文件末尾
-            init_match = re.search(r'\(:init\s+(.*?)\s*\)\s*\)', problem_pddl, re.DOTALL)
+            init_match = _INIT_TO_END_RE.search(problem_pddl)
         
         if init_match:
             init_text = init_match.group(1).strip()
@@ -1,5 +1,7 @@
 """回归测试算法 - 纯算法逻辑"""
+import hashlib
 import json
+import logging
 import os
 import shutil
 from typing import List, Dict
@@ -9,6 +11,9 @@ from interface.translator import ITranslator
 from interface.planner import IPlanner
 from interface.storage import IStorage
 from interface.llm import ILLM
+from utils import fast_json
+
+logger = logging.getLogger("AxiomLabs_regression")
 
 
 class RegressionAlgorithm:
@@ -17,21 +22,138 @@ class RegressionAlgorithm:
     纯算法逻辑，只依赖接口
     """
 
-    def __init__(self, registry_path: str):
+    def __init__(self, registry_path: str, cache_path: str = None, environment_paths: List[str] = None):
         """
         初始化回归测试算法
 
         :param registry_path: 测试用例注册表路径
+        :param cache_path: 通过记录缓存路径，默认与注册表同目录的 regression_cache.json
+        :param environment_paths: 影响用例结果的其他输入（文件或目录，如核心技能、MCP服务器脚本、
+                                  基础Domain、工作区），其内容变化时缓存的通过记录全部失效
         """
         self.registry_path = registry_path
+        self.cache_path = cache_path or os.path.join(
+            os.path.dirname(registry_path), "regression_cache.json"
+        )
+        self.environment_paths = list(environment_paths or [])
+        # 注册表缓存：(文件mtime_ns, 用例列表, 目标集合)，文件未变化时不重复解析
+        self._registry_cache = None
+
+    def _load_pass_cache(self, context_key: str) -> Dict[str, str]:
+        """
+        加载当前上下文下已通过用例的缓存 {用例哈希: 测试目标}
+
+        缓存文件只保存一个上下文的记录，上下文（候选技能、候选Domain、环境）变化时旧记录直接丢弃。
+
+        :param context_key: 当前上下文哈希
+        :return: 通过记录
+        """
+        if not os.path.exists(self.cache_path):
+            return {}
+
+        try:
+            cached = fast_json.load_file(self.cache_path)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(cached, dict) or cached.get("context") != context_key:
+            return {}
+        passed = cached.get("passed")
+        return passed if isinstance(passed, dict) else {}
+
+    def _save_pass_cache(self, context_key: str, pass_cache: Dict[str, str]):
+        """持久化当前上下文的通过记录（先写临时文件再原子替换，避免中断时留下损坏的缓存）"""
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            fast_json.dump_file({"context": context_key, "passed": pass_cache}, tmp_path)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning("[Regression] 写入通过记录缓存失败: %s", e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def _context_key(skill_bytes: bytes, domain_bytes: bytes, environment_digest: str) -> str:
+        """
+        计算用例运行上下文的哈希：候选技能、候选Domain与环境均未变化时结果相同
+
+        :param skill_bytes: 候选技能脚本内容
+        :param domain_bytes: 候选Domain内容
+        :param environment_digest: 环境输入的摘要（见 _environment_digest）
+        :return: sha256 十六进制摘要
+        """
+        digest = hashlib.sha256()
+        for part in (skill_bytes, domain_bytes, environment_digest.encode('ascii')):
+            # 带长度前缀，避免相邻字段拼接产生歧义
+            digest.update(len(part).to_bytes(8, 'big'))
+            digest.update(part)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _case_key(context_key: str, test_case: Dict) -> str:
+        """
+        计算用例的内容哈希：上下文与用例定义均未变化时结果相同
+
+        :param context_key: 运行上下文哈希（见 _context_key）
+        :param test_case: 测试用例
+        :return: sha256 十六进制摘要
+        """
+        digest = hashlib.sha256(context_key.encode('ascii'))
+        # 缓存键固定使用标准库 json 序列化，保证是否安装 orjson 都得到相同的键
+        digest.update(json.dumps(test_case, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _environment_digest(self) -> str:
+        """
+        计算环境输入的摘要：逐个文件哈希相对路径与内容（目录递归，忽略 __pycache__）
+
+        :return: sha256 十六进制摘要
+        """
+        digest = hashlib.sha256()
+        for path in self.environment_paths:
+            digest.update(path.encode('utf-8') + b"\0")
+            if os.path.isdir(path):
+                for root, dirs, files in os.walk(path):
+                    dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+                    for name in sorted(files):
+                        file_path = os.path.join(root, name)
+                        digest.update(os.path.relpath(file_path, path).encode('utf-8') + b"\0")
+                        content = self._read_bytes(file_path)
+                        digest.update(len(content).to_bytes(8, 'big'))
+                        digest.update(content)
+            elif os.path.exists(path):
+                content = self._read_bytes(path)
+                digest.update(len(content).to_bytes(8, 'big'))
+                digest.update(content)
+            else:
+                digest.update(b"<missing>")
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read_bytes(path: str) -> bytes:
+        """读取文件内容，文件不存在时返回空字节串"""
+        if not path or not os.path.exists(path):
+            return b""
+        with open(path, 'rb') as f:
+            return f.read()
 
     def load_tests(self) -> List[Dict]:
         """加载所有回归测试用例"""
         if not os.path.exists(self.registry_path):
+            self._registry_cache = None
             return []
 
-        with open(self.registry_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        mtime_ns = os.stat(self.registry_path).st_mtime_ns
+        if self._registry_cache is None or self._registry_cache[0] != mtime_ns:
+            tests = fast_json.load_file(self.registry_path)
+            self._registry_cache = (mtime_ns, tests, {t['goal'] for t in tests})
+
+        return list(self._registry_cache[1])
+
+    def _known_goals(self) -> set:
+        """已收录的测试目标集合"""
+        self.load_tests()
+        return self._registry_cache[2] if self._registry_cache else set()
 
     def save_new_test(self, task_data: Dict):
         """将新学会的任务加入回归测试库"""
@@ -44,16 +166,19 @@ class RegressionAlgorithm:
         }
 
         # 避免重复
-        if any(t['goal'] == new_entry['goal'] for t in tests):
-            print(f"[Regression] 测试用例已存在，跳过添加")
+        goals = self._known_goals()
+        if new_entry['goal'] in goals:
+            logger.info("[Regression] 测试用例已存在，跳过添加")
             return
 
         tests.append(new_entry)
 
-        with open(self.registry_path, 'w', encoding='utf-8') as f:
-            json.dump(tests, f, indent=4, ensure_ascii=False)
+        fast_json.dump_file(tests, self.registry_path)
+
+        goals.add(new_entry['goal'])
+        self._registry_cache = (os.stat(self.registry_path).st_mtime_ns, tests, goals)
 
-        print(f"[Regression] 新任务已收录至回归库: {new_entry['goal']}")
+        logger.info("[Regression] 新任务已收录至回归库: %s", new_entry['goal'])
 
     def run_regression_suite(
         self,
@@ -82,11 +207,31 @@ class RegressionAlgorithm:
         tests = self.load_tests()
 
         if not tests:
-            print("[Regression] 测试库为空，跳过回归测试。")
+            logger.info("[Regression] 测试库为空，跳过回归测试。")
             return True
 
-        print(f"\n{'#'*20} 启动回归测试 (共 {len(tests)} 个用例) {'#'*20}")
-        print("目的: 验证新加入的功能是否破坏了原有能力。")
+        logger.info("%s 启动回归测试 (共 %d 个用例) %s", '#' * 20, len(tests), '#' * 20)
+        logger.info("目的: 验证新加入的功能是否破坏了原有能力。")
+
+        # 跳过相同内容下已经通过的用例
+        context_key = self._context_key(
+            self._read_bytes(candidate_skill_path),
+            self._read_bytes(candidate_domain_path),
+            self._environment_digest()
+        )
+        pass_cache = self._load_pass_cache(context_key)
+
+        pending = []
+        for idx, test_case in enumerate(tests):
+            case_key = self._case_key(context_key, test_case)
+            if case_key in pass_cache:
+                logger.info("[Regression Case %d/%d] [PASS cached] %s", idx + 1, len(tests), test_case['goal'])
+            else:
+                pending.append((idx, test_case, case_key))
+
+        if not pending:
+            logger.info("[Regression] 所有测试用例通过（缓存）！新能力验证安全。")
+            return True
 
         # 创建回归沙盒
         reg_sandbox_path = sandbox_manager.create_sandbox()
@@ -97,28 +242,34 @@ class RegressionAlgorithm:
 
         all_passed = True
 
-        for idx, test_case in enumerate(tests):
-            print(f"\n[Regression Case {idx+1}/{len(tests)}] 测试目标: {test_case['goal']}")
+        # 创建执行器（整个套件共用，候选技能只加载一次）
+        # 注意：MCP 服务器启动时会 chdir 到沙盒存储目录，而每个用例都会删除并重建该目录，
+        # 因此每次重置存储后都必须断开连接，让下一次执行重新启动服务器进程
+        reg_executor = executor_factory()
+        disconnect_executor = getattr(reg_executor, "disconnect", None)
 
-            # 重置环境
-            sandbox_manager.reset_jail_storage()
+        # 加载新技能
+        if candidate_skill_path and os.path.exists(candidate_skill_path):
+            reg_executor.register_skill_from_file(candidate_skill_path)
 
-            # 创建执行器
-            reg_executor = executor_factory()
+        # 设置base_path
+        reg_executor.set_storage_path(sandbox_manager.get_storage_path())
 
-            # 加载新技能
-            if candidate_skill_path and os.path.exists(candidate_skill_path):
-                reg_executor.register_skill_from_file(candidate_skill_path)
+        for idx, test_case, case_key in pending:
+            logger.info("[Regression Case %d/%d] 测试目标: %s", idx + 1, len(tests), test_case['goal'])
 
-            # 设置base_path
-            reg_executor.set_storage_path(sandbox_manager.get_storage_path())
+            # 重置环境
+            sandbox_manager.reset_jail_storage()
+            if disconnect_executor is not None:
+                disconnect_executor()
+            reg_executor.clear_execution_history()
 
             # 执行Setup Actions
             if 'setup_actions' in test_case:
-                for action in test_case['setup_actions']:
-                    verb = action[0]
-                    args = action[1:] if len(action) > 1 else []
-                    reg_executor.execute(f"{verb} {' '.join(args)}")
+                reg_executor.execute_batch([
+                    f"{action[0]} {' '.join(action[1:])}"
+                    for action in test_case['setup_actions']
+                ])
 
             # 创建内核
             reg_planner = planner_factory()
@@ -148,20 +299,22 @@ class RegressionAlgorithm:
                 success = kernel.run(test_case['goal'])
 
                 if success:
-                    print(f"  -> [PASS] 测试用例通过。")
+                    logger.info("  -> [PASS] 测试用例通过。")
+                    pass_cache[case_key] = test_case['goal']
+                    self._save_pass_cache(context_key, pass_cache)
                 else:
-                    print(f"  -> [FAIL] 任务执行失败。")
+                    logger.warning("[Regression Case %d/%d] [FAIL] 任务执行失败: %s", idx + 1, len(tests), test_case['goal'])
                     all_passed = False
                     break
 
             except Exception as e:
-                print(f"  -> [ERROR] 测试过程发生异常: {e}")
+                logger.warning("[Regression Case %d/%d] [ERROR] 测试过程发生异常: %s", idx + 1, len(tests), e)
                 all_passed = False
                 break
 
         if all_passed:
-            print(f"\n[Regression] 所有测试用例通过！新能力验证安全。")
+            logger.info("[Regression] 所有测试用例通过！新能力验证安全。")
         else:
-            print(f"\n[Regression] 警告：新能力导致回归测试失败，拒绝合并。")
+            logger.warning("[Regression] 新能力导致回归测试失败，拒绝合并。")
 
         return all_passed
@@ -2,12 +2,14 @@
 import sys
 import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加项目根路径到Python路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.settings import Settings
 from app.training_factory import TrainingFactory
+from utils.logging_setup import setup_logging
 
 
 def parse_arguments():
@@ -79,10 +81,6 @@ def run_training_round(components, config, task_data, round_num, total_rounds):
     """运行一轮训练"""
     print(f"\n{'='*30} 第 {round_num}/{total_rounds} 轮训练 {'='*30}\n")
 
-    # 创建新的执行器（使用已设置的环境变量）
-    base_executor = components['create_executor']()
-    base_executor.clear_execution_history()
-
     # 2. 使用已创建的沙盒（不再重复创建）
     sandbox_path = components['sandbox_manager'].get_sandbox_path()
     print(f"[Trainer] 使用已创建的沙盒: {sandbox_path}\n")
@@ -148,6 +146,19 @@ def run_training_round(components, config, task_data, round_num, total_rounds):
         return False
 
 
+def reset_shared_executor(executor, config):
+    """
+    将跨轮次共用的执行器恢复到干净状态：主存储路径 + 仅核心技能
+
+    :param executor: 共用的执行器
+    :param config: 配置对象
+    """
+    os.environ.pop('SANDBOX_STORAGE_PATH', None)
+    os.environ.pop('SANDBOX_MCP_SKILLS_DIR', None)
+    executor.rebind_paths(config.storage_path)
+    executor.unbind_sandbox_skills()
+
+
 def main():
     """自主学习模式主函数"""
     args = parse_arguments()
@@ -175,56 +186,70 @@ def main():
 
     # 1. 加载配置
     config = Settings.load_from_env()
+    # 日志配置需在 .env 加载之后，以便读取 REGRESSION_LOG_LEVEL
+    setup_logging()
     print(f"[Main] 配置加载完成\n")
 
     # 2. 创建训练组件
     components = TrainingFactory.create_training_components(config)
     
+    # 所有轮次共用进化算法的执行器，每轮仅重新绑定沙盒路径
+    base_executor = components['evolution_algorithm'].executor
+    reset_shared_executor(base_executor, config)
+    
     success_count = 0
     
     for round_num in range(1, args.rounds + 1):
-        # 1. 先创建沙盒环境
-        print(f"\n[Trainer] 正在为第 {round_num}/{args.rounds} 轮创建沙盒环境...")
-        sandbox = components['sandbox_manager'].create_sandbox()
-        
-        # 2. 设置环境变量，确保MCP服务器能正确识别沙盒路径
-        sandbox_storage_path = components['sandbox_manager'].get_storage_path()
-        sandbox_skills_dir = os.path.join(components['sandbox_manager'].get_sandbox_path(), "skills")
+        try:
+            # 1. 后台创建沙盒环境，与 LLM 出题并行（两者互不依赖）
+            print(f"\n[Trainer] 正在为第 {round_num}/{args.rounds} 轮创建沙盒环境...")
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                sandbox_future = pool.submit(components['sandbox_manager'].create_sandbox)
+            
+                # 2. 获取任务数据
+                if args.task:
+                    # 指定任务模式
+                    print(f"[Trainer] 正在根据用户目标生成具体任务...")
+                    task_data = components['curriculum_algorithm'].propose_specific_task(
+                        task_goal=args.task,
+                        executor=base_executor
+                    )
+                else:
+                    # 自动模式
+                    print("[Trainer] 正在请求 LLM 出题...")
+                    task_data = components['curriculum_algorithm'].propose_next_task(base_executor)
+            
+                sandbox = sandbox_future.result()
         
-        os.environ['SANDBOX_STORAGE_PATH'] = sandbox_storage_path
-        os.environ['SANDBOX_MCP_SKILLS_DIR'] = sandbox_skills_dir
+            # 3. 设置环境变量，确保MCP服务器能正确识别沙盒路径
+            sandbox_storage_path = components['sandbox_manager'].get_storage_path()
+            sandbox_skills_dir = os.path.join(components['sandbox_manager'].get_sandbox_path(), "skills")
         
-        print(f"[Trainer] 环境变量已设置:")
-        print(f"  - SANDBOX_STORAGE_PATH: {sandbox_storage_path}")
-        print(f"  - SANDBOX_MCP_SKILLS_DIR: {sandbox_skills_dir}")
+            os.environ['SANDBOX_STORAGE_PATH'] = sandbox_storage_path
+            os.environ['SANDBOX_MCP_SKILLS_DIR'] = sandbox_skills_dir
         
-        # 3. 创建执行器（使用正确的环境变量）
-        base_executor = components['create_executor']()
-        base_executor.clear_execution_history()
+            print(f"[Trainer] 环境变量已设置:")
+            print(f"  - SANDBOX_STORAGE_PATH: {sandbox_storage_path}")
+            print(f"  - SANDBOX_MCP_SKILLS_DIR: {sandbox_skills_dir}")
         
-        # 4. 获取任务数据
-        if args.task:
-            # 指定任务模式
-            print(f"[Trainer] 正在根据用户目标生成具体任务...")
-            task_data = components['curriculum_algorithm'].propose_specific_task(
-                task_goal=args.task,
-                executor=base_executor
-            )
-        else:
-            # 自动模式
-            print("[Trainer] 正在请求 LLM 出题...")
-            task_data = components['curriculum_algorithm'].propose_next_task(base_executor)
+            # 4. 将共享执行器绑定到本轮沙盒
+            base_executor.rebind_paths(sandbox_storage_path, sandbox_skills_dir)
+            base_executor.clear_execution_history()
         
-        if not task_data:
-            print("[Trainer] 无法生成任务，跳过本轮。")
-            continue
+            if not task_data:
+                print("[Trainer] 无法生成任务，跳过本轮。")
+                continue
         
-        print(f"[Trainer] 任务生成成功: {task_data['goal']}")
-        print(f"[Trainer] 理由: {task_data['rationale']}\n")
+            print(f"[Trainer] 任务生成成功: {task_data['goal']}")
+            print(f"[Trainer] 理由: {task_data['rationale']}\n")
         
-        # 5. 运行训练轮次（传入已创建的沙盒信息）
-        if run_training_round(components, config, task_data, round_num, args.rounds):
-            success_count += 1
+            # 5. 运行训练轮次（传入已创建的沙盒信息）
+            if run_training_round(components, config, task_data, round_num, args.rounds):
+                success_count += 1
+        finally:
+            # 无论本轮成功、跳过还是异常，都将共用执行器恢复到主存储 + 仅核心技能，
+            # 下一轮出题时不会沿用本轮沙盒的路径或技能
+            reset_shared_executor(base_executor, config)
 
     print("\n" + "="*80)
     print(f"[System] 自主学习模式已完成")
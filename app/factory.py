@@ -200,7 +200,18 @@ class AxiomLabsFactory:
         if not os.path.exists(skills_path):
             return
         
-        for filename in os.listdir(skills_path):
-            if filename.endswith("_skill.py") and filename != "base_skill.py":
-                skill_file = os.path.join(skills_path, filename)
+        skill_files = [
+            os.path.join(skills_path, filename)
+            for filename in os.listdir(skills_path)
+            if filename.endswith("_skill.py") and filename != "base_skill.py"
+        ]
+        if not skill_files:
+            return
+        
+        # 支持批量注册的执行器整批只重启一次客户端
+        register_batch = getattr(executor, "register_skills_from_files", None)
+        if register_batch is not None:
+            register_batch(skill_files)
+        else:
+            for skill_file in skill_files:
                 executor.register_skill_from_file(skill_file)
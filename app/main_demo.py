@@ -7,6 +7,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.settings import Settings
 from app.factory import AxiomLabsFactory
+from utils.logging_setup import setup_logging
 
 
 def print_usage():
@@ -69,6 +70,7 @@ def main():
 
     # 1. 加载配置
     config = Settings.load_from_env()
+    setup_logging()
     print(f"[Main] 配置加载完成")
     print(f"  - 项目路径: {config.project_root}")
     print(f"  - 存储路径: {config.storage_path}")
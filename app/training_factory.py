@@ -2,6 +2,7 @@
 import os
 import shutil
 from config.settings import Settings
+from config.constants import Constants
 from app.factory import AxiomLabsFactory
 
 # 算法层
@@ -79,13 +80,17 @@ class TrainingFactory:
         # 创建课程算法
         curriculum_algorithm = CurriculumAlgorithm(
             llm=llm,
-            storage=storage
+            storage=storage,
+            # 首轮出题用轻量模型，重试时换回主模型；轻量模型默认与主模型相同，
+            # 未设置 DEEPSEEK_LIGHT_MODEL 时三次调用实际使用同一个模型
+            models=[config.llm_light_model, config.llm_model, config.llm_model]
         )
         print(f"[Factory] 课程算法已创建")
 
         # 创建回归测试算法
         regression_algorithm = RegressionAlgorithm(
-            registry_path=os.path.join(config.pddl_configs_path, "regression_registry.json")
+            registry_path=os.path.join(config.pddl_configs_path, "regression_registry.json"),
+            environment_paths=TrainingFactory._regression_environment_paths(config)
         )
         print(f"[Factory] 回归测试算法已创建")
 
@@ -172,13 +177,17 @@ class TrainingFactory:
         # 创建课程算法
         curriculum_algorithm = CurriculumAlgorithm(
             llm=llm,
-            storage=storage
+            storage=storage,
+            # 首轮出题用轻量模型，重试时换回主模型；轻量模型默认与主模型相同，
+            # 未设置 DEEPSEEK_LIGHT_MODEL 时三次调用实际使用同一个模型
+            models=[config.llm_light_model, config.llm_model, config.llm_model]
         )
         print(f"[Factory] 课程算法已创建")
 
         # 创建回归测试算法
         regression_algorithm = RegressionAlgorithm(
-            registry_path=os.path.join(config.pddl_configs_path, "regression_registry.json")
+            registry_path=os.path.join(config.pddl_configs_path, "regression_registry.json"),
+            environment_paths=TrainingFactory._regression_environment_paths(config)
         )
         print(f"[Factory] 回归测试算法已创建")
 
@@ -199,6 +208,25 @@ class TrainingFactory:
             "config": config
         }
 
+    @staticmethod
+    def _regression_environment_paths(config: Settings) -> list:
+        """
+        回归用例结果所依赖的环境输入：核心技能、MCP服务器脚本、基础Domain与工作区
+
+        :param config: 配置对象
+        :return: 文件或目录路径列表
+        """
+        server_script = next(
+            (arg for arg in config.mcp_server_args.split() if arg.endswith(".py")),
+            Constants.DEFAULT_MCP_SERVER_SCRIPT
+        )
+        return [
+            os.path.join(config.project_root, "infrastructure", "mcp_skills"),
+            os.path.join(config.project_root, server_script),
+            config.get_domain_file_path(),
+            config.storage_path,
+        ]
+
     @staticmethod
     def _load_extended_skills(executor, skills_path: str):
         """加载扩展技能（MCP执行器自动从服务器加载，此方法保留为空）"""
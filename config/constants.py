@@ -5,6 +5,7 @@
 这些常量可以在Settings类中被环境变量覆盖。
 """
 
+from types import MappingProxyType
 from typing import Dict, Any
 
 
@@ -57,10 +58,17 @@ class Constants:
     # DeepSeek API配置
     DEFAULT_LLM_BASE_URL = "https://api.deepseek.com"
     DEFAULT_LLM_MODEL = "deepseek-chat"
+    # 轻量模型：用于领域路由、首轮出题等简单请求
+    # 默认与主模型相同（DeepSeek 没有比 deepseek-chat 更便宜的对话模型），此时路由分流不改变实际调用；
+    # 接入其他 OpenAI 兼容服务时可通过 DEEPSEEK_LIGHT_MODEL 指定更便宜的模型
+    DEFAULT_LLM_LIGHT_MODEL = DEFAULT_LLM_MODEL
     
     # LLM调用参数
     DEFAULT_LLM_TEMPERATURE = 0.0
     DEFAULT_LLM_MAX_TOKENS = 2000
+    # 领域路由只需返回领域名称：输出上限按最长领域名称的 UTF-8 字节数（字节级分词下 token 数不超过字节数）
+    # 再加上这部分余量（容纳空白、引号等）
+    ROUTE_DOMAIN_EXTRA_TOKENS = 8
     
     # ========== MCP配置常量 ==========
     
@@ -87,17 +95,18 @@ class Constants:
     # 技能类名
     GENERATED_SKILL_CLASS_NAME = "GeneratedSkill"
     
-    # 基础技能列表（用于进化算法）
-    BASE_SKILLS = ["scan", "move", "get_admin", "remove_file", "compress"]
-    
-    # 类型映射：谓词 -> 参数位置 -> 类型（用于文件管理领域）
-    TYPE_MAPPING = {
-        "at": {0: "file", 1: "folder"},
-        "connected": {0: "folder", 1: "folder"},
-        "scanned": {0: "folder"},
-        "is_created": {0: "file"},
-        "is_compressed": {0: "file", 1: "archive"},
-    }
+    # 基础技能列表（用于进化算法，不可变，成员判断使用 frozenset）
+    BASE_SKILLS = ("scan", "move", "get_admin", "remove_file", "compress")
+    BASE_SKILL_SET = frozenset(BASE_SKILLS)
+    
+    # 类型映射：谓词 -> 参数位置 -> 类型（用于文件管理领域，只读视图，全局共享）
+    TYPE_MAPPING = MappingProxyType({
+        "at": MappingProxyType({0: "file", 1: "folder"}),
+        "connected": MappingProxyType({0: "folder", 1: "folder"}),
+        "scanned": MappingProxyType({0: "folder"}),
+        "is_created": MappingProxyType({0: "file"}),  # 也可能是folder，但默认为file
+        "is_compressed": MappingProxyType({0: "file", 1: "archive"}),
+    })
     
     # ========== 沙盒相关常量 ==========
     
@@ -1,14 +1,145 @@
 """配置管理类"""
 import os
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import Optional, Dict, Any, NamedTuple
 from config.constants import Constants
+from utils import fast_json
 
+# 沙盒路径拼接使用的分隔符（沙盒目录与子目录名均为已知的相对名称，直接拼接即可）
+_SEP = os.sep
 
-@dataclass
+# 已加载过 .env 的项目根目录（同一根目录进程内只读取一次，invalidate_cache 时清空）
+_DOTENV_LOADED_ROOTS = set()
+
+# load_from_env 结果缓存: 项目根目录 -> Settings
+_SETTINGS_CACHE: Dict[str, "Settings"] = {}
+
+
+class _ProjectPaths(NamedTuple):
+    """由项目根目录派生的各路径"""
+    pddl_configs_path: str
+    storage_path: str
+    sandbox_runs_path: str
+    skills_path: str
+    temp_dir: str
+    downward_path: str
+    domain_file_path: str
+    problem_file_path: str
+
+
+# 默认项目根目录（config 目录的上一级），导入时解析一次
+_DEFAULT_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@lru_cache(maxsize=4)
+def _resolve_paths(project_root: str) -> _ProjectPaths:
+    """
+    计算并缓存项目根目录下的各路径
+
+    :param project_root: 项目根目录
+    :return: 路径集合
+    """
+    return _ProjectPaths(
+        pddl_configs_path=os.path.join(project_root, Constants.PDDL_CONFIGS_DIR_NAME),
+        storage_path=os.path.join(project_root, Constants.WORKSPACE_DIR_NAME),
+        sandbox_runs_path=os.path.join(project_root, Constants.SANDBOX_RUNS_DIR_NAME),
+        skills_path=os.path.join(project_root, Constants.SKILLS_RELATIVE_PATH),
+        temp_dir=os.path.join(project_root, Constants.TEMP_DIR_NAME),
+        downward_path=os.path.join(project_root, "downward", "fast-downward.py"),
+        domain_file_path=os.path.join(project_root, Constants.PDDL_CONFIGS_DIR_NAME, Constants.DOMAIN_FILE_NAME),
+        problem_file_path=os.path.join(project_root, Constants.PDDL_CONFIGS_DIR_NAME, Constants.PROBLEM_FILE_NAME),
+    )
+
+
+def _env_bool(value: str) -> bool:
+    """环境变量布尔值解析（仅 "true" 为真，忽略大小写）"""
+    return value.lower() == "true"
+
+
+# 环境变量映射表: (字段名, 环境变量名, 默认值, 类型转换函数)
+_ENV_SPEC = (
+    ("llm_api_key", "DEEPSEEK_API_KEY", "", str),
+    ("llm_base_url", "DEEPSEEK_BASE_URL", Constants.DEFAULT_LLM_BASE_URL, str),
+    ("llm_model", "DEEPSEEK_MODEL", Constants.DEFAULT_LLM_MODEL, str),
+    ("llm_light_model", "DEEPSEEK_LIGHT_MODEL", Constants.DEFAULT_LLM_LIGHT_MODEL, str),
+    ("llm_temperature", "LLM_TEMPERATURE", Constants.DEFAULT_LLM_TEMPERATURE, float),
+    ("llm_max_tokens", "LLM_MAX_TOKENS", Constants.DEFAULT_LLM_MAX_TOKENS, int),
+    ("max_iterations", "MAX_ITERATIONS", Constants.DEFAULT_MAX_ITERATIONS, int),
+    ("max_evolution_retries", "MAX_EVOLUTION_RETRIES", Constants.DEFAULT_MAX_EVOLUTION_RETRIES, int),
+    ("planning_timeout", "PLANNING_TIMEOUT", Constants.DEFAULT_PLANNING_TIMEOUT, int),
+    ("use_mcp", "USE_MCP", False, _env_bool),
+    ("mcp_server_command", "MCP_SERVER_COMMAND", Constants.DEFAULT_MCP_SERVER_COMMAND, str),
+    ("mcp_server_args", "MCP_SERVER_ARGS", Constants.DEFAULT_MCP_SERVER_ARGS, str),
+    ("mcp_connection_timeout", "MCP_CONNECTION_TIMEOUT", Constants.MCP_CONNECTION_TIMEOUT, float),
+    ("mcp_tool_call_timeout", "MCP_TOOL_CALL_TIMEOUT", Constants.MCP_TOOL_CALL_TIMEOUT, float),
+    ("mcp_disconnect_timeout", "MCP_DISCONNECT_TIMEOUT", Constants.MCP_DISCONNECT_TIMEOUT, float),
+    ("domain_name", "DOMAIN_NAME", Constants.DEFAULT_DOMAIN_NAME, str),
+    ("evolution_max_retries", "EVOLUTION_MAX_RETRIES", Constants.DEFAULT_EVOLUTION_MAX_RETRIES, int),
+    ("evolution_max_pddl_retries", "EVOLUTION_MAX_PDDL_RETRIES", Constants.DEFAULT_EVOLUTION_MAX_PDDL_RETRIES, int),
+    ("curriculum_max_retries", "CURRICULUM_MAX_RETRIES", Constants.DEFAULT_CURRICULUM_MAX_RETRIES, int),
+    ("generated_skill_class_name", "GENERATED_SKILL_CLASS_NAME", Constants.GENERATED_SKILL_CLASS_NAME, str),
+    ("pddl_ai_generated_comment", "PDDL_AI_GENERATED_COMMENT", Constants.PDDL_AI_GENERATED_COMMENT, str),
+)
+
+
+def _load_dotenv(project_root: str):
+    """
+    加载项目根目录下的 .env 文件到环境变量（已存在的环境变量不覆盖）
+
+    :param project_root: 项目根目录
+    """
+    env_path = os.path.join(project_root, ".env")
+    if not os.path.isfile(env_path):
+        return
+    # 仅在确实需要读取 .env 时才导入 python-dotenv
+    from dotenv import load_dotenv
+    load_dotenv(env_path)
+
+
+# to_dict 输出的字段（按输出顺序），属性读取由 attrgetter 一次完成
+_DICT_KEYS = (
+    'project_root',
+    'pddl_configs_path',
+    'storage_path',
+    'sandbox_runs_path',
+    'skills_path',
+    'temp_dir',
+    'downward_path',
+    'llm_api_key',
+    'llm_base_url',
+    'llm_model',
+    'llm_light_model',
+    'llm_temperature',
+    'llm_max_tokens',
+    'max_iterations',
+    'max_evolution_retries',
+    'planning_timeout',
+    'use_mcp',
+    'mcp_server_command',
+    'mcp_server_args',
+    'mcp_connection_timeout',
+    'mcp_tool_call_timeout',
+    'mcp_disconnect_timeout',
+    'domain_name',
+    'domain_file_name',
+    'problem_file_name',
+    'sandbox_storage_dir_name',
+    'sandbox_skills_dir_name',
+    'sandbox_domain_file_name',
+    'evolution_max_retries',
+    'evolution_max_pddl_retries',
+    'curriculum_max_retries',
+    'generated_skill_class_name',
+    'pddl_ai_generated_comment',
+)
+_DICT_GETTER = attrgetter(*_DICT_KEYS)
+
+
+@dataclass(slots=True)
 class Settings:
-    """AxiomLabs系统配置 - 简化版"""
+    """AxiomLabs系统配置 - 简化版（slots：实例不携带 __dict__，属性读取更快）"""
     
     # ========== 核心路径配置 ==========
     project_root: str
@@ -17,85 +148,87 @@ class Settings:
     # ========== LLM配置 ==========
     llm_api_key: str
     """LLM API密钥"""
-    llm_base_url: str = field(default_factory=lambda: Constants.DEFAULT_LLM_BASE_URL)
+    llm_base_url: str = Constants.DEFAULT_LLM_BASE_URL
     """LLM基础URL"""
-    llm_model: str = field(default_factory=lambda: Constants.DEFAULT_LLM_MODEL)
+    llm_model: str = Constants.DEFAULT_LLM_MODEL
     """LLM模型"""
-    llm_temperature: float = field(default_factory=lambda: Constants.DEFAULT_LLM_TEMPERATURE)
+    llm_light_model: str = Constants.DEFAULT_LLM_LIGHT_MODEL
+    """轻量LLM模型（用于简单请求）"""
+    llm_temperature: float = Constants.DEFAULT_LLM_TEMPERATURE
     """LLM温度"""
-    llm_max_tokens: int = field(default_factory=lambda: Constants.DEFAULT_LLM_MAX_TOKENS)
+    llm_max_tokens: int = Constants.DEFAULT_LLM_MAX_TOKENS
     """LLM最大token数"""
     
     # ========== 算法配置 ==========
-    max_iterations: int = field(default_factory=lambda: Constants.DEFAULT_MAX_ITERATIONS)
+    max_iterations: int = Constants.DEFAULT_MAX_ITERATIONS
     """最大迭代次数"""
-    max_evolution_retries: int = field(default_factory=lambda: Constants.DEFAULT_MAX_EVOLUTION_RETRIES)
+    max_evolution_retries: int = Constants.DEFAULT_MAX_EVOLUTION_RETRIES
     """最大进化重试次数"""
-    planning_timeout: int = field(default_factory=lambda: Constants.DEFAULT_PLANNING_TIMEOUT)
+    planning_timeout: int = Constants.DEFAULT_PLANNING_TIMEOUT
     """规划超时时间（秒）"""
-    evolution_max_retries: int = field(default_factory=lambda: Constants.DEFAULT_EVOLUTION_MAX_RETRIES)
+    evolution_max_retries: int = Constants.DEFAULT_EVOLUTION_MAX_RETRIES
     """进化算法最大重试次数"""
-    evolution_max_pddl_retries: int = field(default_factory=lambda: Constants.DEFAULT_EVOLUTION_MAX_PDDL_RETRIES)
+    evolution_max_pddl_retries: int = Constants.DEFAULT_EVOLUTION_MAX_PDDL_RETRIES
     """进化算法PDDL重试次数"""
-    curriculum_max_retries: int = field(default_factory=lambda: Constants.DEFAULT_CURRICULUM_MAX_RETRIES)
+    curriculum_max_retries: int = Constants.DEFAULT_CURRICULUM_MAX_RETRIES
     """课程算法最大重试次数"""
     
     # ========== MCP配置 ==========
     use_mcp: bool = False
     """是否使用MCP执行器"""
-    mcp_server_command: str = field(default_factory=lambda: Constants.DEFAULT_MCP_SERVER_COMMAND)
+    mcp_server_command: str = Constants.DEFAULT_MCP_SERVER_COMMAND
     """MCP服务器命令"""
-    mcp_server_args: str = field(default_factory=lambda: Constants.DEFAULT_MCP_SERVER_ARGS)
+    mcp_server_args: str = Constants.DEFAULT_MCP_SERVER_ARGS
     """MCP服务器参数"""
-    mcp_connection_timeout: float = field(default_factory=lambda: Constants.MCP_CONNECTION_TIMEOUT)
+    mcp_connection_timeout: float = Constants.MCP_CONNECTION_TIMEOUT
     """MCP连接超时"""
-    mcp_tool_call_timeout: float = field(default_factory=lambda: Constants.MCP_TOOL_CALL_TIMEOUT)
+    mcp_tool_call_timeout: float = Constants.MCP_TOOL_CALL_TIMEOUT
     """MCP工具调用超时"""
-    mcp_disconnect_timeout: float = field(default_factory=lambda: Constants.MCP_DISCONNECT_TIMEOUT)
+    mcp_disconnect_timeout: float = Constants.MCP_DISCONNECT_TIMEOUT
     """MCP断开连接超时"""
     
     # ========== 领域配置 ==========
-    domain_name: str = field(default_factory=lambda: Constants.DEFAULT_DOMAIN_NAME)
+    domain_name: str = Constants.DEFAULT_DOMAIN_NAME
     """领域名称"""
     
     # ========== 执行器配置 ==========
-    generated_skill_class_name: str = field(default_factory=lambda: Constants.GENERATED_SKILL_CLASS_NAME)
+    generated_skill_class_name: str = Constants.GENERATED_SKILL_CLASS_NAME
     """生成的技能类名"""
     
     # ========== PDDL配置 ==========
-    pddl_ai_generated_comment: str = field(default_factory=lambda: Constants.PDDL_AI_GENERATED_COMMENT)
+    pddl_ai_generated_comment: str = Constants.PDDL_AI_GENERATED_COMMENT
     """PDDL AI生成注释"""
     
     # ========== 计算属性（动态生成） ==========
     @property
     def pddl_configs_path(self) -> str:
         """PDDL配置路径"""
-        return os.path.join(self.project_root, Constants.PDDL_CONFIGS_DIR_NAME)
+        return _resolve_paths(self.project_root).pddl_configs_path
     
     @property
     def storage_path(self) -> str:
         """存储路径"""
-        return os.path.join(self.project_root, Constants.WORKSPACE_DIR_NAME)
+        return _resolve_paths(self.project_root).storage_path
     
     @property
     def sandbox_runs_path(self) -> str:
         """沙盒运行路径"""
-        return os.path.join(self.project_root, Constants.SANDBOX_RUNS_DIR_NAME)
+        return _resolve_paths(self.project_root).sandbox_runs_path
     
     @property
     def skills_path(self) -> str:
         """技能路径"""
-        return os.path.join(self.project_root, Constants.SKILLS_RELATIVE_PATH)
+        return _resolve_paths(self.project_root).skills_path
     
     @property
     def temp_dir(self) -> str:
         """临时目录"""
-        return os.path.join(self.project_root, Constants.TEMP_DIR_NAME)
+        return _resolve_paths(self.project_root).temp_dir
     
     @property
     def downward_path(self) -> str:
         """Fast Downward路径"""
-        return os.path.join(self.project_root, "downward", "fast-downward.py")
+        return _resolve_paths(self.project_root).downward_path
     
     @property
     def domain_file_name(self) -> str:
@@ -125,48 +258,61 @@ class Settings:
     @classmethod
     def load_from_env(cls, project_root: Optional[str] = None) -> 'Settings':
         """
-        从环境变量加载配置
+        从环境变量加载配置（同一项目根目录只构建一次，后续调用返回缓存实例）
         
         :param project_root: 项目根路径，如果为None则自动检测
         :return: Settings实例
         """
-        # 加载.env文件
-        load_dotenv()
-        
         # 确定项目根路径
         if project_root is None:
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            project_root = _DEFAULT_PROJECT_ROOT
+        
+        settings = _SETTINGS_CACHE.get(project_root)
+        if settings is None:
+            settings = _SETTINGS_CACHE[project_root] = cls._build_from_env(project_root)
+        return settings
+    
+    @classmethod
+    def invalidate_cache(cls):
+        """清空 load_from_env 的缓存（环境变量或 .env 变化后需要重新加载配置时调用）"""
+        _SETTINGS_CACHE.clear()
+        _DOTENV_LOADED_ROOTS.clear()
+    
+    @classmethod
+    def _build_from_env(cls, project_root: str) -> 'Settings':
+        """
+        读取环境变量构建配置
+        
+        :param project_root: 项目根路径
+        :return: Settings实例
+        """
+        # 加载.env文件（每个项目根目录仅首次调用时）
+        # 容器/CI 环境通过 AXIOMLABS_SKIP_DOTENV 声明环境变量已注入，或所有配置项均已存在时，无需读取 .env
+        root_key = os.path.realpath(project_root)
+        if root_key not in _DOTENV_LOADED_ROOTS:
+            env = os.environ
+            skip_dotenv = (
+                env.get("AXIOMLABS_SKIP_DOTENV", "").lower() in ("1", "true", "yes")
+                or all(var in env for _, var, _, _ in _ENV_SPEC)
+            )
+            if not skip_dotenv:
+                _load_dotenv(project_root)
+            _DOTENV_LOADED_ROOTS.add(root_key)
         
         # 从环境变量读取配置，使用常量作为默认值
-        return cls(
-            project_root=project_root,
-            llm_api_key=os.getenv("DEEPSEEK_API_KEY", ""),
-            llm_base_url=os.getenv("DEEPSEEK_BASE_URL", Constants.DEFAULT_LLM_BASE_URL),
-            llm_model=os.getenv("DEEPSEEK_MODEL", Constants.DEFAULT_LLM_MODEL),
-            llm_temperature=float(os.getenv("LLM_TEMPERATURE", str(Constants.DEFAULT_LLM_TEMPERATURE))),
-            llm_max_tokens=int(os.getenv("LLM_MAX_TOKENS", str(Constants.DEFAULT_LLM_MAX_TOKENS))),
-            max_iterations=int(os.getenv("MAX_ITERATIONS", str(Constants.DEFAULT_MAX_ITERATIONS))),
-            max_evolution_retries=int(os.getenv("MAX_EVOLUTION_RETRIES", str(Constants.DEFAULT_MAX_EVOLUTION_RETRIES))),
-            planning_timeout=int(os.getenv("PLANNING_TIMEOUT", str(Constants.DEFAULT_PLANNING_TIMEOUT))),
-            use_mcp=os.getenv("USE_MCP", "false").lower() == "true",
-            mcp_server_command=os.getenv("MCP_SERVER_COMMAND", Constants.DEFAULT_MCP_SERVER_COMMAND),
-            mcp_server_args=os.getenv("MCP_SERVER_ARGS", Constants.DEFAULT_MCP_SERVER_ARGS),
-            mcp_connection_timeout=float(os.getenv("MCP_CONNECTION_TIMEOUT", str(Constants.MCP_CONNECTION_TIMEOUT))),
-            mcp_tool_call_timeout=float(os.getenv("MCP_TOOL_CALL_TIMEOUT", str(Constants.MCP_TOOL_CALL_TIMEOUT))),
-            mcp_disconnect_timeout=float(os.getenv("MCP_DISCONNECT_TIMEOUT", str(Constants.MCP_DISCONNECT_TIMEOUT))),
-            domain_name=os.getenv("DOMAIN_NAME", Constants.DEFAULT_DOMAIN_NAME),
-            evolution_max_retries=int(os.getenv("EVOLUTION_MAX_RETRIES", str(Constants.DEFAULT_EVOLUTION_MAX_RETRIES))),
-            evolution_max_pddl_retries=int(os.getenv("EVOLUTION_MAX_PDDL_RETRIES", str(Constants.DEFAULT_EVOLUTION_MAX_PDDL_RETRIES))),
-            curriculum_max_retries=int(os.getenv("CURRICULUM_MAX_RETRIES", str(Constants.DEFAULT_CURRICULUM_MAX_RETRIES))),
-            generated_skill_class_name=os.getenv("GENERATED_SKILL_CLASS_NAME", Constants.GENERATED_SKILL_CLASS_NAME),
-            pddl_ai_generated_comment=os.getenv("PDDL_AI_GENERATED_COMMENT", Constants.PDDL_AI_GENERATED_COMMENT)
-        )
+        env = os.environ
+        kwargs = {
+            name: coerce(env[var]) if var in env else default
+            for name, var, default, coerce in _ENV_SPEC
+        }
+        return cls(project_root=project_root, **kwargs)
     
-    def validate(self, critical_only: bool = False) -> bool:
+    def validate(self, critical_only: bool = False, probe_write: bool = False) -> bool:
         """
         验证配置是否有效
         
         :param critical_only: 是否只验证关键配置（快速检查）
+        :param probe_write: 是否通过实际写入临时文件检查存储目录权限（默认仅用 os.access 检查）
         :return: 配置是否有效
         :raises: ValueError 如果配置无效
         """
@@ -185,26 +331,31 @@ class Settings:
             errors.append(f"❌ Fast-Downward路径不存在: {self.downward_path}")
             errors.append(f"   请确保已安装Fast-Downward或设置正确的DOWNWARD_PATH")
         
-        # 4. 检查pddl_configs目录（包含PDDL文件）
-        if not os.path.exists(self.pddl_configs_path):
+        # 4. 检查pddl_configs目录（包含PDDL文件），一次目录扫描同时确认必要的PDDL文件
+        try:
+            with os.scandir(self.pddl_configs_path) as it:
+                config_files = {entry.name for entry in it}
+        except FileNotFoundError:
             errors.append(f"❌ PDDL配置目录不存在: {self.pddl_configs_path}")
+        except OSError as e:
+            errors.append(f"❌ PDDL配置目录无法读取: {self.pddl_configs_path} ({e})")
         else:
-            # 检查必要的PDDL文件
-            domain_file = os.path.join(self.pddl_configs_path, self.domain_file_name)
-            problem_file = os.path.join(self.pddl_configs_path, self.problem_file_name)
-            
-            if not os.path.exists(domain_file):
-                errors.append(f"❌ Domain文件不存在: {domain_file}")
-            if not os.path.exists(problem_file):
-                errors.append(f"❌ Problem文件不存在: {problem_file}")
+            if self.domain_file_name not in config_files:
+                errors.append(f"❌ Domain文件不存在: {os.path.join(self.pddl_configs_path, self.domain_file_name)}")
+            if self.problem_file_name not in config_files:
+                errors.append(f"❌ Problem文件不存在: {os.path.join(self.pddl_configs_path, self.problem_file_name)}")
         
         # 5. 检查workspace目录（会被自动创建，但需要检查权限）
         try:
-            os.makedirs(self.storage_path, exist_ok=True)
-            test_file = os.path.join(self.storage_path, ".test_write")
-            with open(test_file, 'w') as f:
-                f.write("test")
-            os.remove(test_file)
+            if not os.path.isdir(self.storage_path):
+                os.makedirs(self.storage_path, exist_ok=True)
+            if probe_write:
+                test_file = os.path.join(self.storage_path, ".test_write")
+                with open(test_file, 'w') as f:
+                    f.write("test")
+                os.remove(test_file)
+            elif not os.access(self.storage_path, os.W_OK):
+                raise PermissionError("不可写")
         except Exception as e:
             errors.append(f"❌ 存储目录无写入权限: {self.storage_path} ({e})")
         
@@ -242,62 +393,30 @@ class Settings:
     
     def get_domain_file_path(self) -> str:
         """获取Domain文件完整路径"""
-        return os.path.join(self.pddl_configs_path, self.domain_file_name)
+        return _resolve_paths(self.project_root).domain_file_path
     
     def get_problem_file_path(self) -> str:
         """获取Problem文件完整路径"""
-        return os.path.join(self.pddl_configs_path, self.problem_file_name)
+        return _resolve_paths(self.project_root).problem_file_path
     
     def get_sandbox_domain_path(self, sandbox_dir: str) -> str:
         """获取沙盒中的Domain文件路径"""
-        return os.path.join(sandbox_dir, self.sandbox_domain_file_name)
+        return f"{sandbox_dir}{_SEP}{Constants.SANDBOX_DOMAIN_FILE_NAME}"
     
     def get_sandbox_storage_path(self, sandbox_dir: str) -> str:
         """获取沙盒中的存储路径"""
-        return os.path.join(sandbox_dir, self.sandbox_storage_dir_name)
+        return f"{sandbox_dir}{_SEP}{Constants.SANDBOX_STORAGE_DIR_NAME}"
     
     def get_sandbox_skills_path(self, sandbox_dir: str) -> str:
         """获取沙盒中的技能路径"""
-        return os.path.join(sandbox_dir, self.sandbox_skills_dir_name)
+        return f"{sandbox_dir}{_SEP}{Constants.SANDBOX_SKILLS_DIR_NAME}"
     
     def to_dict(self) -> Dict[str, Any]:
         """将配置转换为字典"""
-        return {
-            'project_root': self.project_root,
-            'pddl_configs_path': self.pddl_configs_path,
-            'storage_path': self.storage_path,
-            'sandbox_runs_path': self.sandbox_runs_path,
-            'skills_path': self.skills_path,
-            'temp_dir': self.temp_dir,
-            'downward_path': self.downward_path,
-            'llm_api_key': '***' if self.llm_api_key else '',
-            'llm_base_url': self.llm_base_url,
-            'llm_model': self.llm_model,
-            'llm_temperature': self.llm_temperature,
-            'llm_max_tokens': self.llm_max_tokens,
-            'max_iterations': self.max_iterations,
-            'max_evolution_retries': self.max_evolution_retries,
-            'planning_timeout': self.planning_timeout,
-            'use_mcp': self.use_mcp,
-            'mcp_server_command': self.mcp_server_command,
-            'mcp_server_args': self.mcp_server_args,
-            'mcp_connection_timeout': self.mcp_connection_timeout,
-            'mcp_tool_call_timeout': self.mcp_tool_call_timeout,
-            'mcp_disconnect_timeout': self.mcp_disconnect_timeout,
-            'domain_name': self.domain_name,
-            'domain_file_name': self.domain_file_name,
-            'problem_file_name': self.problem_file_name,
-            'sandbox_storage_dir_name': self.sandbox_storage_dir_name,
-            'sandbox_skills_dir_name': self.sandbox_skills_dir_name,
-            'sandbox_domain_file_name': self.sandbox_domain_file_name,
-            'evolution_max_retries': self.evolution_max_retries,
-            'evolution_max_pddl_retries': self.evolution_max_pddl_retries,
-            'curriculum_max_retries': self.curriculum_max_retries,
-            'generated_skill_class_name': self.generated_skill_class_name,
-            'pddl_ai_generated_comment': self.pddl_ai_generated_comment
-        }
+        d = dict(zip(_DICT_KEYS, _DICT_GETTER(self)))
+        d['llm_api_key'] = '***' if self.llm_api_key else ''
+        return d
     
     def __str__(self) -> str:
         """返回配置的字符串表示"""
-        import json
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return fast_json.dumps(self.to_dict())
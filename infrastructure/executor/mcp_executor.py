@@ -7,14 +7,38 @@ MCP 动作执行器 (重构版)
 """
 
 import asyncio
-import sys
+import logging
 import os
+import threading
 from typing import Dict, List, Optional
 from interface.executor import IExecutor, ExecutionResult
 from infrastructure.mcp_client import SimpleMCPClient
 from infrastructure.pddl.pddl_state_updater import PDDLDelta
 from infrastructure.skills.parameter_mapper import get_default_mapper, map_action_to_arguments
 
+logger = logging.getLogger("AxiomLabs_mcp_executor")
+
+# 传递给 MCP 服务器子进程的环境变量白名单：
+# 服务器只读取沙盒路径，其余为 Python 解释器/虚拟环境/编码所需
+# （mcp 的 stdio_client 还会合并 HOME、PATH 等默认变量）
+_MCP_ENV_ALLOWLIST = (
+    "SANDBOX_STORAGE_PATH",
+    "SANDBOX_MCP_SKILLS_DIR",
+    "PATH",
+    "HOME",
+    "PYTHONPATH",
+    "PYTHONHOME",
+    "PYTHONIOENCODING",
+    "PYTHONUTF8",
+    "VIRTUAL_ENV",
+    "CONDA_PREFIX",
+    "LANG",
+    "LC_ALL",
+    "LC_CTYPE",
+    "TMPDIR",
+    "SYSTEMROOT",
+)
+
 
 class MCPActionExecutorRefactored(IExecutor):
     """基于 MCP 的动作执行器 (重构版)"""
@@ -34,23 +58,27 @@ class MCPActionExecutorRefactored(IExecutor):
         sandbox_storage_path = os.environ.get("SANDBOX_STORAGE_PATH")
         if sandbox_storage_path:
             self.storage_path = sandbox_storage_path
-            print(f"[MCP Executor] 使用环境变量SANDBOX_STORAGE_PATH: {self.storage_path}")
+            logger.info("[MCP Executor] 使用环境变量SANDBOX_STORAGE_PATH: %s", self.storage_path)
         else:
             self.storage_path = storage_path or ""
             if self.storage_path:
-                print(f"[MCP Executor] 使用传入的storage_path: {self.storage_path}")
+                logger.info("[MCP Executor] 使用传入的storage_path: %s", self.storage_path)
         
         self.execution_history: List[str] = []
         self.server_command = server_command
         self.server_args = server_args or ["mcp_server_structured.py"]  # 使用标准版服务器
-        # 保存当前环境变量，用于传递给MCP服务器子进程
-        self.server_env = os.environ.copy()
+        # 仅保存MCP服务器子进程需要的环境变量（白名单），不复制整个 os.environ
+        environ = os.environ
+        self.server_env = {key: environ[key] for key in _MCP_ENV_ALLOWLIST if key in environ}
         self.client = SimpleMCPClient(
             server_command=server_command,
             server_args=self.server_args,
             server_env=self.server_env
         )
         self._connected = False
+        self._tool_set: Optional[frozenset] = None  # 当前连接的工具名称集合，每次（重新）连接时刷新
+        # 连接状态锁：防止并发的首次执行各自 connect 而启动多个服务器子进程（可重入，重启流程内部会嵌套获取）
+        self._conn_lock = threading.RLock()
         self.config = config
         
         # 参数映射器
@@ -59,21 +87,25 @@ class MCPActionExecutorRefactored(IExecutor):
         # 初始化日志已移除，由工厂统一输出
 
     def _ensure_connected(self) -> bool:
-        """确保客户端已连接"""
-        if not self._connected:
+        """确保客户端已连接（双重检查加锁，已连接时无锁快速返回）"""
+        if self._connected:
+            return True
+        with self._conn_lock:
+            if self._connected:
+                return True
             try:
                 success = self.client.connect()
                 if success:
                     self._connected = True
-                    tool_names = self.client.get_tool_names()
-                    print(f"[MCP] 连接成功 ({len(tool_names)} 工具)", file=sys.stderr)
+                    self._tool_set = frozenset(self.client.get_tool_names())
+                    logger.info("[MCP] 连接成功 (%d 工具)", len(self._tool_set))
                 else:
-                    print("[MCP] 连接失败", file=sys.stderr)
+                    logger.error("[MCP] 连接失败")
                     return False
             except Exception as e:
-                print(f"[MCP] 连接异常: {e}", file=sys.stderr)
+                logger.error("[MCP] 连接异常: %s", e)
                 return False
-        return True
+            return True
 
     def execute(self, action_str: str) -> ExecutionResult:
         """
@@ -85,62 +117,83 @@ class MCPActionExecutorRefactored(IExecutor):
         Returns:
             ExecutionResult 对象
         """
-        # 记录执行历史
-        self.execution_history.append(action_str.split()[0].lower() if action_str.strip() else "")
-
-        # 确保连接
+        # 确保连接（连接失败时动作从未发出，不记录执行历史）
         if not self._ensure_connected():
             return ExecutionResult(
                 False,
                 f"MCP 连接失败，无法执行动作"
             )
 
-        try:
-            # 使用参数映射器解析动作
-            tool_name, arguments = map_action_to_arguments(action_str)
-            
-            # 检查工具是否存在
-            if not self.client.has_tool(tool_name):
-                return ExecutionResult(
-                    False,
-                    f"MCP 工具不存在: {tool_name}"
-                )
-            
-            # 验证参数
-            is_valid, error_msg = self.parameter_mapper.validate_parameters(tool_name, arguments)
-            if not is_valid:
-                return ExecutionResult(False, f"参数验证失败: {error_msg}")
-            
-            # 调用工具
-            response = self.client.call_tool(tool_name, arguments)
-            
-            if response.success:
-                # 提取 pddl_delta 并添加到结果中
-                pddl_delta = response.pddl_delta or ""
-                print(f"[MCP Executor DEBUG] tool={tool_name}, pddl_delta={pddl_delta}", file=sys.stderr)
-                
-                # 解析 delta 字符串为单独的事实
-                delta = PDDLDelta.parse(pddl_delta)
-                return ExecutionResult(
-                    True,
-                    response.message,
-                    add_facts=delta.add_facts,
-                    del_facts=delta.del_facts
-                )
-            else:
-                return ExecutionResult(
+        prepared = self._prepare_call(action_str)
+        if isinstance(prepared, ExecutionResult):
+            result = prepared
+        else:
+            tool_name, arguments = prepared
+            try:
+                # 调用工具
+                response = self.client.call_tool(tool_name, arguments)
+                result = self._to_execution_result(tool_name, response)
+            except Exception as e:
+                result = ExecutionResult(
                     False,
-                    f"MCP 工具调用失败: {response.error}"
+                    f"MCP 调用异常: {str(e)}"
                 )
-                
+
+        # 动作处理完毕后再记录执行历史
+        self.execution_history.append(action_str.split()[0].lower() if action_str.strip() else "")
+        return result
+
+    def _prepare_call(self, action_str: str):
+        """
+        解析并校验动作
+
+        Returns:
+            (工具名称, 参数) 元组；解析或校验失败时返回 ExecutionResult
+        """
+        try:
+            # 使用参数映射器解析并验证动作（相同动作命中缓存）
+            tool_name, arguments, is_valid, error_msg = self.parameter_mapper.prepare_action(action_str)
         except ValueError as e:
             return ExecutionResult(False, f"动作解析失败: {str(e)}")
         except Exception as e:
+            return ExecutionResult(False, f"MCP 调用异常: {str(e)}")
+
+        # 检查工具是否存在（本地集合查询，不经过客户端包装层）
+        tool_set = self._tool_set
+        if tool_set is None:
+            tool_set = self._tool_set = frozenset(self.client.get_tool_names())
+        if tool_name not in tool_set:
             return ExecutionResult(
                 False,
-                f"MCP 调用异常: {str(e)}"
+                f"MCP 工具不存在: {tool_name}"
             )
 
+        # 验证结果
+        if not is_valid:
+            return ExecutionResult(False, f"参数验证失败: {error_msg}")
+
+        return tool_name, arguments
+
+    def _to_execution_result(self, tool_name: str, response) -> ExecutionResult:
+        """将 MCP 响应转换为 ExecutionResult"""
+        if response.success:
+            # 提取 pddl_delta 并添加到结果中
+            pddl_delta = response.pddl_delta or ""
+            logger.debug("[MCP Executor] tool=%s, pddl_delta=%s", tool_name, pddl_delta)
+
+            # 解析 delta 字符串为单独的事实
+            delta = PDDLDelta.parse(pddl_delta)
+            return ExecutionResult(
+                True,
+                response.message,
+                add_facts=delta.add_facts,
+                del_facts=delta.del_facts
+            )
+        return ExecutionResult(
+            False,
+            f"MCP 工具调用失败: {response.error}"
+        )
+
     def get_execution_history(self) -> List[str]:
         """获取执行历史记录"""
         return self.execution_history.copy()
@@ -160,83 +213,94 @@ class MCPActionExecutorRefactored(IExecutor):
         
         注意：此方法仅在沙盒环境中有效，用于进化算法临时加载新技能
         """
+        return self.register_skills_from_files([file_path]) > 0
+
+    def register_skills_from_files(self, file_paths: List[str]) -> int:
+        """
+        批量部署技能文件，整批最多重启/重连一次 MCP 客户端
+
+        沙盒路径只写入 self.server_env（MCP 服务器子进程的环境），
+        不再修改当前进程的 os.environ。
+
+        Args:
+            file_paths: 技能文件路径列表
+
+        Returns:
+            成功登记的技能文件数量
+        """
         # 检查是否为沙盒环境（通过存储路径判断）
         if not self.storage_path:
             # 非沙盒环境，保持原行为（静默忽略）
-            return False
+            return 0
         
-        # 确保文件存在
-        if not os.path.exists(file_path):
-            return False
+        # 仅处理存在的文件，技能目录取最后一个文件所在目录（应该是沙盒的skills目录）
+        existing = [path for path in file_paths if os.path.exists(path)]
+        if not existing:
+            return 0
         
-        # 获取技能文件所在的目录（应该是沙盒的skills目录）
-        skill_dir = os.path.dirname(file_path)
-        
-        # 验证技能目录是否是沙盒的skills目录
-        if "skills" not in skill_dir:
-            print(f"[MCP Executor] 警告：技能文件不在skills目录中: {file_path}")
-        
-        print(f"[MCP Executor] 使用现有技能文件: {file_path}")
+        skill_dir = os.path.dirname(existing[-1])
+        for file_path in existing:
+            # 验证技能目录是否是沙盒的skills目录
+            if "skills" not in os.path.dirname(file_path):
+                logger.warning("[MCP Executor] 技能文件不在skills目录中: %s", file_path)
+            logger.info("[MCP Executor] 使用现有技能文件: %s", file_path)
         
         # 检查技能目录是否发生变化
         current_skill_dir = self.server_env.get("SANDBOX_MCP_SKILLS_DIR")
         skill_dir_changed = current_skill_dir != skill_dir
         
-        # 设置环境变量（当前进程和MCP服务器子进程）
+        # 设置MCP服务器子进程的环境变量
         self.server_env["SANDBOX_MCP_SKILLS_DIR"] = skill_dir
-        os.environ["SANDBOX_MCP_SKILLS_DIR"] = skill_dir
-        
-        # 设置沙盒存储路径环境变量
-        sandbox_storage_path = os.environ.get("SANDBOX_STORAGE_PATH", self.storage_path)
-        self.server_env["SANDBOX_STORAGE_PATH"] = sandbox_storage_path
-        os.environ["SANDBOX_STORAGE_PATH"] = sandbox_storage_path
+        self.server_env["SANDBOX_STORAGE_PATH"] = os.environ.get("SANDBOX_STORAGE_PATH", self.storage_path)
         
         # 仅在技能目录变化时才重启MCP客户端
         if skill_dir_changed:
-            print(f"[MCP Executor] 技能目录变化 ({current_skill_dir} -> {skill_dir})，重启MCP客户端")
+            logger.info("[MCP Executor] 技能目录变化 (%s -> %s)，重启MCP客户端", current_skill_dir, skill_dir)
             self._restart_mcp_client()
         else:
-            print(f"[MCP Executor] 技能目录未变化，跳过重启，依赖服务器动态加载")
+            logger.info("[MCP Executor] 技能目录未变化，跳过重启，依赖服务器动态加载")
             # 可选：强制刷新工具列表（轻量级）
             self._force_reconnect()
         
-        return True
+        return len(existing)
     
     def _restart_mcp_client(self):
         """重启MCP客户端以应用新的环境变量和技能目录，带异常处理"""
-        print("[MCP Executor] 重启MCP客户端以应用沙盒技能...")
+        with self._conn_lock:
+            logger.info("[MCP Executor] 重启MCP客户端以应用沙盒技能...")
         
-        # 断开当前连接（忽略任何异常）
-        if self._connected:
+            # 断开当前连接（忽略任何异常）
+            if self._connected:
+                try:
+                    self.client.disconnect()
+                except Exception as e:
+                    logger.warning("[MCP Executor] 断开连接时发生异常（忽略）: %s", e)
+                finally:
+                    self._connected = False
+        
+            # 重新创建MCP客户端，传递更新后的环境变量
             try:
-                self.client.disconnect()
+                from infrastructure.mcp_client import SimpleMCPClient
+                self.client = SimpleMCPClient(
+                    server_command=self.server_command,
+                    server_args=self.server_args,
+                    server_env=self.server_env
+                )
             except Exception as e:
-                print(f"[MCP Executor] 断开连接时发生异常（忽略）: {e}", file=sys.stderr)
-            finally:
-                self._connected = False
+                logger.error("[MCP Executor] 创建MCP客户端失败: %s", e)
+                # 即使失败，也继续执行，因为可能后续连接会恢复
         
-        # 重新创建MCP客户端，传递更新后的环境变量
-        try:
-            from infrastructure.mcp_client import SimpleMCPClient
-            self.client = SimpleMCPClient(
-                server_command=self.server_command,
-                server_args=self.server_args,
-                server_env=self.server_env
-            )
-        except Exception as e:
-            print(f"[MCP Executor] 创建MCP客户端失败: {e}", file=sys.stderr)
-            # 即使失败，也继续执行，因为可能后续连接会恢复
-        
-        # 强制下次执行时重新连接
-        print("[MCP Executor] MCP客户端已重启，等待下次执行时连接")
+            # 强制下次执行时重新连接
+            logger.info("[MCP Executor] MCP客户端已重启，等待下次执行时连接")
     
     def _force_reconnect(self):
         """强制重新连接MCP客户端以获取最新工具列表"""
-        if self._connected:
-            print("[MCP Executor] 重新连接MCP客户端以刷新工具列表...")
-            self.client.disconnect()
-            self._connected = False
-            # 下次执行时会自动重新连接
+        with self._conn_lock:
+            if self._connected:
+                logger.info("[MCP Executor] 重新连接MCP客户端以刷新工具列表...")
+                self.client.disconnect()
+                self._connected = False
+                # 下次执行时会自动重新连接
 
     def get_registered_skills(self) -> List[str]:
         """获取可用的工具名称"""
@@ -250,17 +314,52 @@ class MCPActionExecutorRefactored(IExecutor):
         # 同时更新server_env中的SANDBOX_STORAGE_PATH环境变量
         self.server_env["SANDBOX_STORAGE_PATH"] = path
 
+    def rebind_paths(self, storage_path: str, skills_dir: str = None):
+        """
+        将执行器重新绑定到新的沙盒路径，用于跨训练轮次复用同一个执行器
+
+        MCP 服务器在启动时读取沙盒环境变量并切换工作目录，
+        因此仅在路径确实变化且已连接时重启客户端。
+
+        Args:
+            storage_path: 沙盒存储路径
+            skills_dir: 沙盒技能目录（可选）
+        """
+        with self._conn_lock:
+            changed = self.server_env.get("SANDBOX_STORAGE_PATH") != storage_path
+            self.set_storage_path(storage_path)
+
+            if skills_dir is not None:
+                changed = changed or self.server_env.get("SANDBOX_MCP_SKILLS_DIR") != skills_dir
+                self.server_env["SANDBOX_MCP_SKILLS_DIR"] = skills_dir
+
+            if changed and self._connected:
+                self._restart_mcp_client()
+
+    def unbind_sandbox_skills(self):
+        """
+        解除沙盒技能目录绑定，使 MCP 服务器只加载核心技能
+
+        用于跨轮次复用执行器时，在新沙盒创建前列出可用动作，
+        避免上一轮沙盒中生成（或被拒绝）的技能混入。
+        """
+        with self._conn_lock:
+            removed = self.server_env.pop("SANDBOX_MCP_SKILLS_DIR", None) is not None
+            if removed and self._connected:
+                self._restart_mcp_client()
+
     def disconnect(self):
         """断开 MCP 连接"""
-        if self._connected:
-            self.client.disconnect()
-            self._connected = False
-            # 静默断开，不输出日志
+        with self._conn_lock:
+            if self._connected:
+                self.client.disconnect()
+                self._connected = False
+                # 静默断开，不输出日志
     
     def load_parameter_mappings(self, filepath: str):
         """加载参数映射配置"""
         self.parameter_mapper.load_mappings_from_file(filepath)
-        print(f"[MCP Executor] 已加载参数映射配置: {filepath}")
+        logger.info("[MCP Executor] 已加载参数映射配置: %s", filepath)
 
 
 # 向后兼容的别名
@@ -1,6 +1,6 @@
 """DeepSeek LLM客户端实现"""
 from openai import OpenAI
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
 from interface.llm import ILLM
 
 
@@ -22,7 +22,9 @@ class DeepSeekClient(ILLM):
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0,
-        response_format: Dict[str, Any] = None
+        response_format: Dict[str, Any] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None
     ) -> str:
         """
         调用LLM进行对话
@@ -30,16 +32,70 @@ class DeepSeekClient(ILLM):
         :param messages: 消息列表
         :param temperature: 温度参数
         :param response_format: 响应格式
+        :param model: 本次调用使用的模型，为None时使用默认模型
+        :param max_tokens: 最大输出token数
         :return: LLM响应内容
         """
         kwargs = {
-            "model": self.model,
+            "model": model or self.model,
             "messages": messages,
             "temperature": temperature
         }
 
         if response_format:
             kwargs["response_format"] = response_format
+        if max_tokens:
+            kwargs["max_tokens"] = max_tokens
 
         response = self.client.chat.completions.create(**kwargs)
         return response.choices[0].message.content
+
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0,
+        response_format: Dict[str, Any] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        stop_condition: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """
+        流式调用LLM，满足 stop_condition 时立即关闭连接，不再等待剩余输出
+
+        :param messages: 消息列表
+        :param temperature: 温度参数
+        :param response_format: 响应格式
+        :param model: 本次调用使用的模型，为None时使用默认模型
+        :param max_tokens: 最大输出token数
+        :param stop_condition: 接收已累积文本的判定函数
+        :return: LLM响应内容
+        """
+        kwargs = {
+            "model": model or self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "stream": True
+        }
+
+        if response_format:
+            kwargs["response_format"] = response_format
+        if max_tokens:
+            kwargs["max_tokens"] = max_tokens
+
+        stream = self.client.chat.completions.create(**kwargs)
+
+        chunks = []
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                chunks.append(delta)
+                if stop_condition is not None and stop_condition("".join(chunks)):
+                    break
+        finally:
+            stream.close()
+
+        return "".join(chunks)
@@ -10,7 +10,7 @@ import json
 import subprocess
 import sys
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
 
@@ -102,6 +102,7 @@ class MCPClient:
         self.status = ConnectionStatus.DISCONNECTED
         self.session: Optional[ClientSession] = None
         self.tools: List[MCPTool] = []
+        self._tool_names: Set[str] = set()  # 工具名称集合，与 self.tools 同步维护，供 O(1) 查询
         self.server_process: Optional[subprocess.Popen] = None
         self._connection_lock = asyncio.Lock()
         self._stdio_context = None
@@ -188,6 +189,7 @@ class MCPClient:
         try:
             result = await self.session.list_tools()
             self.tools = []
+            self._tool_names = set()
             
             # 处理返回结果：可能是 ListToolsResult 对象或元组列表
             tools_list = []
@@ -244,10 +246,12 @@ class MCPClient:
                     input_schema=input_schema
                 )
                 self.tools.append(mcp_tool)
+                self._tool_names.add(name)
                 
         except Exception as e:
             print(f"[MCP] 获取工具列表失败: {e}", file=sys.stderr)
             self.tools = []
+            self._tool_names = set()
     
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> MCPResponse:
         """
@@ -404,7 +408,7 @@ class MCPClient:
     
     def has_tool(self, tool_name: str) -> bool:
         """检查是否包含指定工具"""
-        return any(tool.name == tool_name for tool in self.tools)
+        return tool_name in self._tool_names
 
 
 class SimpleMCPClient:
@@ -88,16 +88,13 @@ class MCPBaseSkill(ABC):
         # 或者保持在项目根目录（正常模式）
         # 这里直接使用当前工作目录作为基础路径
         
-        safe_parts = []
-        for part in parts:
-            # 将 _dot_ 替换回 .
-            if '_dot_' in part:
-                part = part.replace('_dot_', '.')
-            safe_parts.append(part)
+        # 将 _dot_ 替换回 .（不含 _dot_ 的部分直接复用）
+        safe_parts = [part.replace('_dot_', '.') if '_dot_' in part else part for part in parts]
         
         # 构建完整路径
-        full_path = os.path.join(os.getcwd(), *safe_parts)
-        logger.debug(f"_safe_path: 工作目录={os.getcwd()}, 部分={parts}, 完整路径={full_path}")
+        cwd = os.getcwd()
+        full_path = os.path.join(cwd, *safe_parts)
+        logger.debug("_safe_path: 工作目录=%s, 部分=%s, 完整路径=%s", cwd, parts, full_path)
         return full_path
     
     def _to_pddl_name(self, filename: str) -> str:
@@ -2,6 +2,8 @@
 """
 移动文件技能
 """
+import errno
+import os
 import shutil
 from typing import Dict, Any, List
 from .mcp_base_skill import MCPBaseSkill
@@ -39,7 +41,17 @@ class MoveSkill(MCPBaseSkill):
         dst_path = self._safe_path(to_folder, file_name)
         
         try:
-            shutil.move(src_path, dst_path)
+            # 同一文件系统内直接 rename（单次系统调用），跨设备时回退到 shutil.move；
+            # 目标是已存在的目录时 os.replace 会失败或替换空目录，保留 shutil.move 移入目录内的行为
+            if os.path.isdir(dst_path):
+                shutil.move(src_path, dst_path)
+            else:
+                try:
+                    os.replace(src_path, dst_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(src_path, dst_path)
             message = f"移动 {file_name} 从 {from_folder} 到 {to_folder}"
             pddl_delta = f"-(at {file_name} {from_folder}) +(at {file_name} {to_folder})"
             return self.create_success_response(message, pddl_delta)
@@ -35,30 +35,30 @@ class ScanSkill(MCPBaseSkill):
         if not os.path.exists(target_path):
             return self.create_error_response(f"目录 {folder} 不存在")
         
+        # 使用 scandir：DirEntry 的类型判断直接复用 readdir 结果，无需逐项 stat
+        found_facts = []
+        item_count = 0
         try:
-            files = os.listdir(target_path)
+            with os.scandir(target_path) as entries:
+                for entry in entries:
+                    item_count += 1
+                    # 忽略系统文件
+                    if entry.name.startswith("."):
+                        continue
+                    
+                    safe_name = self._to_pddl_name(entry.name)
+                    if entry.is_file():
+                        found_facts.append(f"(at {safe_name} {folder})")
+                    elif entry.is_dir():
+                        # 双向连接性
+                        found_facts.append(f"(connected {folder} {safe_name})")
+                        found_facts.append(f"(connected {safe_name} {folder})")
         except Exception as e:
             return self.create_error_response(f"无法扫描目录: {str(e)}")
         
-        # 生成PDDL事实
-        found_facts = []
-        for f in files:
-            # 忽略系统文件
-            if f.startswith("."):
-                continue
-            
-            safe_name = self._to_pddl_name(f)
-            full_path = os.path.join(target_path, f)
-            if os.path.isfile(full_path):
-                found_facts.append(f"(at {safe_name} {folder})")
-            elif os.path.isdir(full_path):
-                # 双向连接性
-                found_facts.append(f"(connected {folder} {safe_name})")
-                found_facts.append(f"(connected {safe_name} {folder})")
-        
         found_facts.append(f"(scanned {folder})")
         
         # 构建PDDL delta字符串，用空格分隔多个事实
         pddl_delta = " ".join(found_facts)
-        message = f"扫描文件夹 {folder} 完成，发现 {len(files)} 个项目"
+        message = f"扫描文件夹 {folder} 完成，发现 {item_count} 个项目"
         return self.create_success_response(message, pddl_delta)
\ No newline at end of file
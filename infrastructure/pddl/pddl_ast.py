@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+PDDL Domain 语法树
+
+将 domain.pddl 解析为轻量的结构化表示（S表达式递归下降解析），
+并按文件内容缓存解析结果，避免每次使用时重新解析整个文件。
+缓存以内容为键而不是 mtime/大小：粗粒度时间戳的文件系统上，同一时刻内写入的等长内容也不会命中旧结果。
+每个 Action 记录其在源文本中的位置，修改时只需替换对应片段，保留原文件的注释与排版。
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# 词法单元：注释、括号、原子
+_TOKEN_RE = re.compile(r";[^\n]*|[()]|[^\s();]+")
+
+
+class PDDLParseError(ValueError):
+    """PDDL 解析错误"""
+    pass
+
+
+@dataclass(frozen=True)
+class Action:
+    """Domain 中的一个 Action"""
+    name: str
+    parameters: tuple
+    precondition: Optional[tuple]
+    effect: Optional[tuple]
+    span: Tuple[int, int]  # 在源文本中的位置 [start, end)
+
+
+@dataclass(frozen=True)
+class Domain:
+    """Domain 语法树"""
+    name: str
+    requirements: tuple
+    types: tuple
+    predicates: tuple
+    actions: Tuple[Action, ...]
+    source: str
+    close_offset: int  # (define ...) 最外层右括号在源文本中的位置
+
+    @property
+    def action_names(self) -> List[str]:
+        """所有 Action 名称"""
+        return [action.name for action in self.actions]
+
+    def get_action(self, name: str) -> Optional[Action]:
+        """
+        按名称查找 Action
+
+        :param name: Action名称
+        :return: Action对象，不存在时返回None
+        """
+        for action in self.actions:
+            if action.name == name:
+                return action
+        return None
+
+    def with_action(self, action_pddl: str, comment: str = "") -> str:
+        """
+        生成追加了新 Action 的 Domain 文本（插入到 define 的闭合括号之前）
+
+        :param action_pddl: Action PDDL代码
+        :param comment: 插入在Action之前的注释行
+        :return: 新的Domain文本
+        """
+        header = f"\n{comment}\n" if comment else "\n"
+        return (
+            self.source[:self.close_offset] +
+            header + action_pddl + "\n" +
+            self.source[self.close_offset:]
+        )
+
+    def without_action(self, name: str) -> Optional[str]:
+        """
+        生成删除了指定 Action 的 Domain 文本
+
+        :param name: Action名称
+        :return: 新的Domain文本，Action不存在时返回None
+        """
+        action = self.get_action(name)
+        if action is None:
+            return None
+        start, end = action.span
+        return self.source[:start] + self.source[end:]
+
+
+def _tokenize(text: str) -> List[Tuple[str, int, int]]:
+    """切分词法单元，返回 (token, start, end) 列表，忽略注释"""
+    return [
+        (m.group(0), m.start(), m.end())
+        for m in _TOKEN_RE.finditer(text)
+        if not m.group(0).startswith(";")
+    ]
+
+
+def _parse_expr(tokens: List[Tuple[str, int, int]], pos: int):
+    """
+    递归下降解析一个S表达式
+
+    :return: (表达式, 起始位置, 结束位置, 下一个token下标)
+    """
+    token, start, end = tokens[pos]
+    if token == ")":
+        raise PDDLParseError(f"括号不匹配：位置 {start} 出现多余的右括号")
+    if token != "(":
+        return token, start, end, pos + 1
+
+    items = []
+    pos += 1
+    while pos < len(tokens):
+        if tokens[pos][0] == ")":
+            return tuple(items), start, tokens[pos][2], pos + 1
+        item, _, _, pos = _parse_expr(tokens, pos)
+        items.append(item)
+    raise PDDLParseError(f"括号不匹配：位置 {start} 的左括号未闭合")
+
+
+def parse_forms(text: str) -> List[tuple]:
+    """
+    解析文本中的所有顶层S表达式
+
+    :param text: PDDL文本
+    :return: 顶层表达式列表
+    """
+    tokens = _tokenize(text)
+    forms = []
+    pos = 0
+    while pos < len(tokens):
+        form, _, _, pos = _parse_expr(tokens, pos)
+        forms.append(form)
+    return forms
+
+
+def _build_action(form: tuple, span: Tuple[int, int]) -> Action:
+    """从 (:action name :key value ...) 表达式构建 Action"""
+    if len(form) < 2 or not isinstance(form[1], str):
+        raise PDDLParseError("Action 缺少名称")
+    fields = {}
+    for i in range(2, len(form) - 1, 2):
+        fields[form[i]] = form[i + 1]
+    return Action(
+        name=form[1],
+        parameters=fields.get(":parameters", ()),
+        precondition=fields.get(":precondition"),
+        effect=fields.get(":effect"),
+        span=span
+    )
+
+
+def parse_domain(text: str) -> Domain:
+    """
+    解析 Domain 文本
+
+    :param text: Domain PDDL内容
+    :return: Domain对象
+    """
+    tokens = _tokenize(text)
+    if len(tokens) < 2 or tokens[0][0] != "(" or tokens[1][0] != "define":
+        raise PDDLParseError("Domain 必须以 (define 开头")
+
+    name = ""
+    requirements, types, predicates = (), (), ()
+    actions = []
+
+    pos = 2
+    while pos < len(tokens):
+        if tokens[pos][0] == ")":
+            return Domain(
+                name=name,
+                requirements=requirements,
+                types=types,
+                predicates=predicates,
+                actions=tuple(actions),
+                source=text,
+                close_offset=tokens[pos][1]
+            )
+        form, start, end, pos = _parse_expr(tokens, pos)
+        if not isinstance(form, tuple) or not form:
+            continue
+        head = form[0]
+        if head == "domain" and len(form) > 1:
+            name = form[1]
+        elif head == ":requirements":
+            requirements = form[1:]
+        elif head == ":types":
+            types = form[1:]
+        elif head == ":predicates":
+            predicates = form[1:]
+        elif head == ":action":
+            actions.append(_build_action(form, (start, end)))
+
+    raise PDDLParseError("括号不匹配：(define 未闭合")
+
+
+@lru_cache(maxsize=8)
+def _parse_domain_cached(text: str) -> Domain:
+    """按文本内容缓存的解析结果（Domain 不可变，可安全共享）"""
+    return parse_domain(text)
+
+
+def load_domain(path: str) -> Domain:
+    """
+    加载并解析 Domain 文件，内容未变化时直接返回缓存的语法树
+
+    :param path: Domain文件路径
+    :return: Domain对象
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return _parse_domain_cached(f.read())
+
+
+def clear_domain_cache():
+    """清空 Domain 解析缓存（写入 Domain 文件后调用，及时释放旧版本的语法树）"""
+    _parse_domain_cached.cache_clear()
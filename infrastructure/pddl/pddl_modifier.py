@@ -4,6 +4,7 @@ import os
 from typing import Optional
 from interface.pddl_modifier import IPDDLModifier
 from config.settings import Settings
+from infrastructure.pddl.pddl_ast import PDDLParseError, clear_domain_cache, load_domain, parse_forms
 
 
 class PDDLModifier(IPDDLModifier):
@@ -29,38 +30,33 @@ class PDDLModifier(IPDDLModifier):
             print(f"[Error] 找不到 Domain 文件: {domain_path}")
             return False
 
-        with open(domain_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-
-        # 1. 检查action是否已经存在
-        action_name_match = re.search(r":action\s+([^\s\n\(]+)", action_pddl)
-        if action_name_match:
-            action_name = action_name_match.group(1)
-            if f":action {action_name}" in content:
-                print(f"[Modifier] Action '{action_name}' 已存在，跳过注入。")
-                return True
+        try:
+            domain = load_domain(domain_path)
+        except PDDLParseError as e:
+            print(f"[Error] Domain 解析失败: {e}")
+            return False
 
-        # 2. 确保action_pddl括号匹配
-        if action_pddl.count('(') != action_pddl.count(')'):
+        # 1. 确保action_pddl括号匹配
+        try:
+            forms = parse_forms(action_pddl)
+        except PDDLParseError:
             print("[Error] LLM 生成的 PDDL 片段括号不匹配！")
             return False
 
-        # 3. 在domain的最后闭合括号之前插入新动作
-        # 找到最后一个闭合括号的位置
-        last_bracket_index = content.rfind(')')
-        if last_bracket_index == -1:
-            return False
+        # 2. 检查action是否已经存在
+        for form in forms:
+            if isinstance(form, tuple) and len(form) > 1 and form[0] == ":action":
+                action_name = form[1]
+                if domain.get_action(action_name) is not None:
+                    print(f"[Modifier] Action '{action_name}' 已存在，跳过注入。")
+                    return True
 
-        # 在最后一个括号之前插入，保留原来的闭合括号
-        new_content = (
-            content[:last_bracket_index] +
-            f"\n{self.config.pddl_ai_generated_comment}\n" +
-            action_pddl + "\n" +
-            content[last_bracket_index:]  # 保留原来的闭合括号
-        )
+        # 3. 在domain的define闭合括号之前插入新动作
+        new_content = domain.with_action(action_pddl, self.config.pddl_ai_generated_comment)
 
         with open(domain_path, 'w', encoding='utf-8') as f:
             f.write(new_content)
+        clear_domain_cache()
 
         print(f"[Modifier] 成功将新 Action 注入到: {domain_path}")
         return True
@@ -77,27 +73,24 @@ class PDDLModifier(IPDDLModifier):
             print(f"[Error] 找不到 Domain 文件: {domain_path}")
             return False
 
-        with open(domain_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # 使用正则表达式匹配整个action块
-        # 匹配 (:action action_name ... ) 整个块
-        pattern = r'\(:action\s+' + re.escape(action_name) + r'\s+[^)]*(?:\([^)]*\)[^)]*)*\)'
+        try:
+            domain = load_domain(domain_path)
+        except PDDLParseError as e:
+            print(f"[Error] Domain 解析失败: {e}")
+            return False
 
-        # 查找匹配
-        match = re.search(pattern, content, re.DOTALL)
-        if not match:
+        # 按语法树中记录的位置删除整个action块
+        new_content = domain.without_action(action_name)
+        if new_content is None:
             print(f"[Modifier] 未找到 Action: {action_name}")
             return False
 
-        # 删除匹配的内容
-        new_content = content[:match.start()] + content[match.end():]
-
         # 清理多余的空行
         new_content = re.sub(r'\n\s*\n', '\n\n', new_content)
 
         with open(domain_path, 'w', encoding='utf-8') as f:
             f.write(new_content)
+        clear_domain_cache()
 
         print(f"[Modifier] 成功删除 Action: {action_name}")
         return True
@@ -113,7 +106,7 @@ class PDDLModifier(IPDDLModifier):
         if not os.path.exists(domain_path):
             return False
 
-        with open(domain_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        return f":action {action_name}" in content
+        try:
+            return load_domain(domain_path).get_action(action_name) is not None
+        except PDDLParseError:
+            return False
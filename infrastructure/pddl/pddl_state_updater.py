@@ -9,9 +9,10 @@ import re
 import os
 from typing import List, Tuple, Set
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class PDDLDelta:
     """PDDL 增量变更"""
     add_facts: List[str]  # 要添加的事实列表，如 ["(scanned root)", "(at file folder)"]
@@ -19,6 +20,19 @@ class PDDLDelta:
     
     @classmethod
     def parse(cls, delta_str: str) -> "PDDLDelta":
+        """
+        解析 pddl_delta 字符串（相同字符串只解析一次，结果缓存为元组）
+
+        每次返回新的列表，调用方修改不会影响缓存。
+
+        :param delta_str: pddl_delta 字符串
+        :return: PDDLDelta 对象
+        """
+        add_facts, del_facts = _parse_delta_cached(delta_str)
+        return cls(add_facts=list(add_facts), del_facts=list(del_facts))
+    
+    @classmethod
+    def _parse_uncached(cls, delta_str: str) -> "PDDLDelta":
         """
         解析 pddl_delta 字符串
         
@@ -145,6 +159,18 @@ class PDDLDelta:
         return " ".join(parts)
 
 
+@lru_cache(maxsize=2048)
+def _parse_delta_cached(delta_str: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    缓存的 delta 解析（MCP 响应中重复的 delta 字符串很常见，如重复扫描同一文件夹）
+
+    :param delta_str: pddl_delta 字符串
+    :return: (添加事实元组, 删除事实元组)
+    """
+    delta = PDDLDelta._parse_uncached(delta_str)
+    return tuple(delta.add_facts), tuple(delta.del_facts)
+
+
 class PDDLStateUpdater:
     """PDDL 状态更新器"""
     
@@ -24,8 +24,9 @@ class LAMAPlanner(IPlanner):
         self.timeout = timeout or self.config.planning_timeout
         self.alias = "lama-first"
 
-        # 确保临时目录存在
-        os.makedirs(self.temp_dir, exist_ok=True)
+        # 确保临时目录存在（已存在时只需一次stat）
+        if not os.path.isdir(self.temp_dir):
+            os.makedirs(self.temp_dir, exist_ok=True)
 
     def plan(self, domain_content: str, problem_content: str) -> PlanningResult:
         """
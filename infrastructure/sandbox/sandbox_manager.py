@@ -1,12 +1,59 @@
 """沙盒管理器实现"""
+import errno
 import os
 import shutil
+import sys
 import time
 from typing import Optional
 from interface.sandbox_manager import ISandboxManager
 from config.settings import Settings
 from config.constants import Constants
 
+try:
+    import fcntl
+except ImportError:  # 非 POSIX 平台
+    fcntl = None
+
+# Linux FICLONE ioctl：在 Btrfs/XFS 等文件系统上创建共享数据块的写时复制克隆
+_FICLONE = 0x40049409
+_reflink_supported = fcntl is not None and sys.platform.startswith("linux")
+# 表示文件系统（或内核）不支持克隆的错误码，出现时不再尝试 reflink；
+# 其他错误（如单个文件的权限、空间问题）只对当前文件回退到普通复制
+_REFLINK_UNSUPPORTED_ERRNOS = frozenset(
+    code for code in (
+        getattr(errno, "EOPNOTSUPP", None),
+        getattr(errno, "ENOTSUP", None),
+        errno.EINVAL,
+        errno.ENOTTY,
+        getattr(errno, "ENOSYS", None),
+    ) if code is not None
+)
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """
+    复制单个文件，优先使用 reflink 写时复制克隆
+
+    克隆只复制元数据，数据块在写入前与源文件共享，技能对沙盒文件的原地写入
+    不会影响主存储。克隆失败时回退到 shutil.copy2；仅当错误表明文件系统不支持克隆时，
+    后续文件才不再尝试。
+
+    :param src: 源文件路径
+    :param dst: 目标文件路径
+    :return: 目标文件路径
+    """
+    global _reflink_supported
+    if _reflink_supported:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError as e:
+            if e.errno in _REFLINK_UNSUPPORTED_ERRNOS:
+                _reflink_supported = False
+    return shutil.copy2(src, dst)
+
 
 class SandboxManager(ISandboxManager):
     """沙盒管理器实现"""
@@ -48,7 +95,7 @@ class SandboxManager(ISandboxManager):
         dst_storage = self.config.get_sandbox_storage_path(sandbox_dir)
 
         if os.path.exists(self.main_storage_path):
-            shutil.copytree(self.main_storage_path, dst_storage)
+            shutil.copytree(self.main_storage_path, dst_storage, copy_function=_clone_file)
             print(f"[Sandbox] 已镜像物理文件系统 (Jail)")
         else:
             os.makedirs(dst_storage, exist_ok=True)
@@ -69,7 +116,7 @@ class SandboxManager(ISandboxManager):
 
         # 重新镜像
         if os.path.exists(self.main_storage_path):
-            shutil.copytree(self.main_storage_path, self.storage_path)
+            shutil.copytree(self.main_storage_path, self.storage_path, copy_function=_clone_file)
         else:
             os.makedirs(self.storage_path, exist_ok=True)
 
@@ -12,6 +12,9 @@ from dataclasses import dataclass, field
 
 logger = logging.getLogger("AxiomLabs_parameter_mapper")
 
+# 动作解析缓存的最大条目数（超出后淘汰最早写入的条目）
+_ACTION_CACHE_SIZE = 1024
+
 
 @dataclass
 class ParameterMapping:
@@ -38,6 +41,8 @@ class ParameterMapper:
     
     def __init__(self):
         self.mappings: Dict[str, ParameterMapping] = {}
+        # 动作字符串 -> (工具名称, 参数键值对元组, 是否有效, 错误信息)
+        self._action_cache: Dict[str, Tuple[str, Tuple[Tuple[str, Any], ...], bool, str]] = {}
         self._initialize_default_mappings()
     
     def _initialize_default_mappings(self):
@@ -157,7 +162,9 @@ class ParameterMapper:
     def register_mapping(self, mapping: ParameterMapping):
         """注册参数映射"""
         self.mappings[mapping.tool_name] = mapping
-        logger.debug(f"注册参数映射: {mapping.tool_name}")
+        # 映射规则变化后，已缓存的解析结果失效
+        self._action_cache.clear()
+        logger.debug("注册参数映射: %s", mapping.tool_name)
     
     def has_mapping(self, tool_name: str) -> bool:
         """检查是否有映射配置"""
@@ -229,9 +236,53 @@ class ParameterMapper:
         for i, arg in enumerate(args):
             arguments[f"arg{i}"] = arg
         
-        logger.debug(f"使用通用参数映射: {tool_name} -> {arguments}")
+        logger.debug("使用通用参数映射: %s -> %s", tool_name, arguments)
         return arguments
     
+    def map_action(self, action_str: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        将动作字符串映射到工具名称和参数字典
+        
+        Args:
+            action_str: 动作字符串（如 "move file_a folder_x folder_y"）
+            
+        Returns:
+            (工具名称, 参数字典)
+        """
+        # 解析动作字符串（无参 split 自带首尾空白处理，无需先 strip 复制一次）
+        parts = action_str.split()
+        if not parts:
+            raise ValueError("动作字符串为空")
+        
+        tool_name = parts[0].lower()
+        return tool_name, self.map_parameters(tool_name, parts[1:])
+    
+    def prepare_action(self, action_str: str) -> Tuple[str, Dict[str, Any], bool, str]:
+        """
+        解析、映射并校验动作，结果按动作字符串缓存
+        
+        规划执行中相同动作反复出现，命中缓存时只需重建一次参数字典。
+        解析失败（抛出 ValueError）的动作不缓存。
+        
+        Args:
+            action_str: 动作字符串
+            
+        Returns:
+            (工具名称, 参数字典, 是否有效, 错误信息)
+        """
+        cached = self._action_cache.get(action_str)
+        if cached is None:
+            tool_name, arguments = self.map_action(action_str)
+            is_valid, error_msg = self.validate_parameters(tool_name, arguments)
+            cached = (tool_name, tuple(arguments.items()), is_valid, error_msg)
+            if len(self._action_cache) >= _ACTION_CACHE_SIZE:
+                del self._action_cache[next(iter(self._action_cache))]
+            self._action_cache[action_str] = cached
+        
+        tool_name, items, is_valid, error_msg = cached
+        # 返回新的参数字典，调用方修改不会污染缓存
+        return tool_name, dict(items), is_valid, error_msg
+    
     def validate_parameters(self, tool_name: str, arguments: Dict[str, Any]) -> Tuple[bool, str]:
         """
         验证参数
@@ -269,9 +320,9 @@ class ParameterMapper:
                 mapping = ParameterMapping(**mapping_data)
                 self.register_mapping(mapping)
             
-            logger.info(f"从文件加载了 {len(data.get('mappings', []))} 个映射配置: {filepath}")
+            logger.info("从文件加载了 %s 个映射配置: %s", len(data.get('mappings', [])), filepath)
         except Exception as e:
-            logger.error(f"加载映射配置文件失败 {filepath}: {e}")
+            logger.error("加载映射配置文件失败 %s: %s", filepath, e)
     
     def save_mappings_to_file(self, filepath: str):
         """保存映射配置到文件"""
@@ -292,9 +343,9 @@ class ParameterMapper:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             
-            logger.info(f"映射配置已保存到: {filepath}")
+            logger.info("映射配置已保存到: %s", filepath)
         except Exception as e:
-            logger.error(f"保存映射配置失败 {filepath}: {e}")
+            logger.error("保存映射配置失败 %s: %s", filepath, e)
 
 
 # 默认参数映射器
@@ -318,21 +369,7 @@ def map_action_to_arguments(action_str: str) -> Tuple[str, Dict[str, Any]]:
     Returns:
         (工具名称, 参数字典)
     """
-    # 解析动作字符串
-    parts = action_str.strip().split()
-    if not parts:
-        raise ValueError("动作字符串为空")
-    
-    tool_name = parts[0].lower()
-    args = parts[1:]
-    
-    # 获取参数映射器
-    mapper = get_default_mapper()
-    
-    # 映射参数
-    arguments = mapper.map_parameters(tool_name, args)
-    
-    return tool_name, arguments
+    return get_default_mapper().map_action(action_str)
 
 
 # 测试函数
@@ -53,13 +53,13 @@ class PathProcessor:
     def _validate_config(self):
         """验证配置"""
         if not os.path.exists(self.config.base_path):
-            logger.warning(f"基础路径不存在: {self.config.base_path}")
+            logger.warning("基础路径不存在: %s", self.config.base_path)
             # 尝试创建目录
             try:
                 os.makedirs(self.config.base_path, exist_ok=True)
-                logger.info(f"已创建基础路径: {self.config.base_path}")
+                logger.info("已创建基础路径: %s", self.config.base_path)
             except Exception as e:
-                logger.error(f"创建基础路径失败: {e}")
+                logger.error("创建基础路径失败: %s", e)
     
     def to_pddl_name(self, filename: str) -> str:
         """
@@ -79,7 +79,7 @@ class PathProcessor:
         
         # 记录转换（调试用）
         if '.' in filename:
-            logger.debug(f"to_pddl_name: {filename} -> {result}")
+            logger.debug("to_pddl_name: %s -> %s", filename, result)
         
         return result
     
@@ -101,7 +101,7 @@ class PathProcessor:
         
         # 记录转换（调试用）
         if self.config.pddl_dot_replacement in pddl_name:
-            logger.debug(f"from_pddl_name: {pddl_name} -> {result}")
+            logger.debug("from_pddl_name: %s -> %s", pddl_name, result)
         
         return result
     
@@ -115,10 +115,9 @@ class PathProcessor:
         Returns:
             绝对路径
         """
-        # 处理PDDL格式的文件名
-        safe_parts = []
-        for part in parts:
-            safe_parts.append(self.from_pddl_name(part))
+        # 处理PDDL格式的文件名（不含替换串的部分直接复用，避免多余的 replace）
+        replacement = self.config.pddl_dot_replacement
+        safe_parts = [part.replace(replacement, '.') if replacement in part else part for part in parts]
         
         # 构建完整路径
         full_path = os.path.join(self.config.base_path, *safe_parts)
@@ -128,22 +127,36 @@ class PathProcessor:
         
         # 安全检查：确保路径在基础路径内（防止目录遍历攻击）
         if not self._is_path_safe(full_path):
-            logger.warning(f"路径安全检查失败: {full_path} 不在基础路径 {self.config.base_path} 内")
+            logger.warning("路径安全检查失败: %s 不在基础路径 %s 内", full_path, self.config.base_path)
             # 返回基础路径作为安全回退
             return self.config.base_path
         
-        logger.debug(f"safe_path: 基础路径={self.config.base_path}, 部分={parts}, 完整路径={full_path}")
+        logger.debug("safe_path: 基础路径=%s, 部分=%s, 完整路径=%s", self.config.base_path, parts, full_path)
         return full_path
     
+    def _base_prefix(self) -> Tuple[str, str]:
+        """
+        基础路径的绝对形式及以分隔符结尾的前缀
+
+        每次按当前 config.base_path 与工作目录计算，不做缓存：
+        base_path 可能被直接修改，相对路径也会随工作目录变化。
+
+        Returns:
+            (绝对基础路径, 以分隔符结尾的前缀)
+        """
+        abs_base = os.path.abspath(self.config.base_path)
+        # 以分隔符结尾的前缀，避免 /foo 误匹配 /foobar（根目录本身已以分隔符结尾）
+        return abs_base, abs_base.rstrip(os.sep) + os.sep
+    
     def _is_path_safe(self, path: str) -> bool:
         """检查路径是否安全（在基础路径内）"""
         try:
             # 获取规范化的绝对路径
             abs_path = os.path.abspath(path)
-            abs_base = os.path.abspath(self.config.base_path)
+            abs_base, abs_base_sep = self._base_prefix()
             
-            # 检查路径是否以基础路径开头
-            return abs_path.startswith(abs_base)
+            # 路径等于基础路径，或位于基础路径之下
+            return abs_path == abs_base or abs_path.startswith(abs_base_sep)
         except Exception:
             return False
     
@@ -157,6 +170,14 @@ class PathProcessor:
         Returns:
             相对路径
         """
+        # 快速路径：位于基础路径之下时直接截取前缀，无需 relpath 的规范化比较
+        abs_path = os.path.abspath(full_path)
+        abs_base, abs_base_sep = self._base_prefix()
+        if abs_path == abs_base:
+            return ""
+        if abs_path.startswith(abs_base_sep):
+            return abs_path[len(abs_base_sep):]
+        
         try:
             rel_path = os.path.relpath(full_path, self.config.base_path)
             # 如果是当前目录，返回空字符串
@@ -178,7 +199,8 @@ class PathProcessor:
             目录路径
         """
         dir_path = self.safe_path(*parts)
-        os.makedirs(dir_path, exist_ok=True)
+        if not os.path.isdir(dir_path):
+            os.makedirs(dir_path, exist_ok=True)
         return dir_path
     
     def file_exists(self, *parts: str) -> bool:
@@ -205,7 +227,7 @@ class PathProcessor:
         try:
             return os.listdir(dir_path)
         except Exception as e:
-            logger.error(f"列出目录失败 {dir_path}: {e}")
+            logger.error("列出目录失败 %s: %s", dir_path, e)
             return []
     
     def update_base_path(self, new_base_path: str):
@@ -216,14 +238,14 @@ class PathProcessor:
         # 验证新路径
         self._validate_config()
         
-        logger.info(f"更新基础路径: {old_base} -> {new_base_path}")
+        logger.info("更新基础路径: %s -> %s", old_base, new_base_path)
     
     def enable_sandbox_mode(self, sandbox_root: str):
         """启用沙盒模式"""
         self.config.enable_sandbox_mode = True
         self.config.sandbox_root = sandbox_root
         self.update_base_path(sandbox_root)
-        logger.info(f"启用沙盒模式，根目录: {sandbox_root}")
+        logger.info("启用沙盒模式，根目录: %s", sandbox_root)
     
     def disable_sandbox_mode(self):
         """禁用沙盒模式"""
@@ -66,13 +66,13 @@ class PythonSkillLoader(ISkillLoader):
             # 实例化技能
             return skill_class()
         except ImportError as e:
-            logger.error(f"导入模块失败 {config.module_path}: {e}")
+            logger.error("导入模块失败 %s: %s", config.module_path, e)
             raise
         except AttributeError as e:
-            logger.error(f"找不到技能类 {config.class_name} 在模块 {config.module_path}: {e}")
+            logger.error("找不到技能类 %s 在模块 %s: %s", config.class_name, config.module_path, e)
             raise
         except Exception as e:
-            logger.error(f"实例化技能失败 {config.name}: {e}")
+            logger.error("实例化技能失败 %s: %s", config.name, e)
             raise
     
     def discover_skills(self, directory: str, patterns: List[str]) -> List[SkillConfig]:
@@ -83,7 +83,7 @@ class PythonSkillLoader(ISkillLoader):
         skills = []
         
         if not os.path.exists(directory):
-            logger.warning(f"技能目录不存在: {directory}")
+            logger.warning("技能目录不存在: %s", directory)
             return skills
         
         # 扫描所有匹配模式的文件
@@ -94,7 +94,7 @@ class PythonSkillLoader(ISkillLoader):
                     if skill_config:
                         skills.append(skill_config)
                 except Exception as e:
-                    logger.error(f"解析技能文件失败 {filepath}: {e}")
+                    logger.error("解析技能文件失败 %s: %s", filepath, e)
         
         return skills
     
@@ -154,7 +154,7 @@ class PythonSkillLoader(ISkillLoader):
             )
             
         except Exception as e:
-            logger.error(f"解析技能文件失败 {filepath}: {e}")
+            logger.error("解析技能文件失败 %s: %s", filepath, e)
             return None
 
 
@@ -184,7 +184,7 @@ class SkillRegistry:
         if not self.skills and self.config.fallback_to_hardcoded:
             self._load_hardcoded_skills()
         
-        logger.info(f"技能注册表初始化完成，共 {len(self.skills)} 个技能")
+        logger.info("技能注册表初始化完成，共 %s 个技能", len(self.skills))
     
     def _load_from_config_file(self):
         """从配置文件加载技能"""
@@ -197,9 +197,9 @@ class SkillRegistry:
                 if config.enabled:
                     self.skills[config.name] = config
                     
-            logger.info(f"从配置文件加载了 {len(config_data.get('skills', []))} 个技能配置")
+            logger.info("从配置文件加载了 %s 个技能配置", len(config_data.get('skills', [])))
         except Exception as e:
-            logger.error(f"加载配置文件失败 {self.config.config_file}: {e}")
+            logger.error("加载配置文件失败 %s: %s", self.config.config_file, e)
     
     def _discover_skills(self):
         """自动发现技能"""
@@ -211,18 +211,18 @@ class SkillRegistry:
                 if os.path.exists(abs_dir):
                     directory = abs_dir
                 else:
-                    logger.warning(f"技能目录不存在: {directory}")
+                    logger.warning("技能目录不存在: %s", directory)
                     continue
             
-            logger.info(f"扫描技能目录: {directory}")
+            logger.info("扫描技能目录: %s", directory)
             discovered = self.loader.discover_skills(directory, self.config.skill_patterns)
             
             for config in discovered:
                 if config.name not in self.skills:
                     self.skills[config.name] = config
-                    logger.info(f"发现技能: {config.name}")
+                    logger.info("发现技能: %s", config.name)
                 else:
-                    logger.debug(f"跳过重复技能: {config.name}")
+                    logger.debug("跳过重复技能: %s", config.name)
     
     def _load_hardcoded_skills(self):
         """加载硬编码技能列表（向后兼容）"""
@@ -278,25 +278,28 @@ class SkillRegistry:
     def register_skill(self, config: SkillConfig):
         """注册技能"""
         self.skills[config.name] = config
-        logger.info(f"注册技能: {config.name}")
+        logger.info("注册技能: %s", config.name)
     
     def get_skill(self, name: str) -> Optional[Any]:
         """获取技能实例（懒加载）"""
-        if name not in self.skills:
+        instance = self.instances.get(name)
+        if instance is not None:
+            return instance
+        
+        config = self.skills.get(name)
+        if config is None:
             return None
         
         # 懒加载：如果还没有实例化，则创建实例
-        if name not in self.instances:
-            try:
-                config = self.skills[name]
-                instance = self.loader.load_skill(config)
-                self.instances[name] = instance
-                logger.debug(f"实例化技能: {name}")
-            except Exception as e:
-                logger.error(f"实例化技能失败 {name}: {e}")
-                return None
+        try:
+            instance = self.loader.load_skill(config)
+            self.instances[name] = instance
+            logger.debug("实例化技能: %s", name)
+        except Exception as e:
+            logger.error("实例化技能失败 %s: %s", name, e)
+            return None
         
-        return self.instances[name]
+        return instance
     
     def get_all_skills(self) -> List[Any]:
         """获取所有技能实例"""
@@ -346,9 +349,9 @@ class SkillRegistry:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(config_data, f, indent=2, ensure_ascii=False)
             
-            logger.info(f"配置已保存到: {filepath}")
+            logger.info("配置已保存到: %s", filepath)
         except Exception as e:
-            logger.error(f"保存配置失败 {filepath}: {e}")
+            logger.error("保存配置失败 %s: %s", filepath, e)
 
 
 # 默认注册表实例
@@ -390,7 +393,7 @@ def register_skill_from_file(filepath: str) -> bool:
             registry.register_skill(config)
             return True
     except Exception as e:
-        logger.error(f"从文件注册技能失败 {filepath}: {e}")
+        logger.error("从文件注册技能失败 %s: %s", filepath, e)
     return False
 
 
@@ -30,6 +30,64 @@ class PDDLTranslator(ITranslator):
         self.storage = storage
         self.domain_experts = domain_experts
         self.config = config or Settings.load_from_env()
+        # 各领域的静态system提示词（领域规则 + 指令）只构建一次，
+        # 每次调用保持相同前缀，便于服务端前缀缓存命中
+        self._system_prompts = {
+            name: self._build_system_prompts(name, expert)
+            for name, expert in domain_experts.items()
+        }
+
+    @staticmethod
+    def _build_system_prompts(domain: str, expert: IDomainExpert) -> Dict[str, str]:
+        """
+        构建领域的静态system提示词
+
+        :param domain: 领域名称
+        :param expert: 领域专家
+        :return: {"first": 第一轮提示词, "goal": 后续轮次提示词}
+        """
+        rules_str = "\n".join(f"{i+1}. {rule}" for i, rule in enumerate(expert.get_rules()))
+
+        first = f"""你现在是[{domain}] 逻辑专家。
+任务：根据"已知环境事实"将用户目标转化为 PDDL Problem。
+
+[核心原则 - 严禁幻觉]:
+1. 你绝对不能将"已知环境事实"或任务中没有提到具体信息的目标写入init或goal中。
+2. 如果"已知环境事实"或任务中没有提到具体信息，你绝对不能猜测信息，优先将目标设置为可获取信息动作后的唯一谓词，且目标仅为此。
+3. 必须在 (:init) 中包含 (= (total-cost) 0)。
+4. 避免关键字：严禁出现exists
+5. 若已知环境事实为空（即显示为"无"），你必须将goal仅设置为获取信息的动作后的唯一谓词。
+6. 严禁发明任何文件对象。如果不知道具体文件名，绝对不能在goal中创建文件对象。
+
+- 执行历史记录了之前执行过的动作，可以帮助你理解当前状态
+- 结合已知事实和执行历史来判断目标是否已完成
+
+[领域逻辑规则]:
+{rules_str}
+
+[输出要求]:
+仅输出 PDDL 代码 或 GOAL_FINISHED_ALREADY。
+"""
+
+        goal = f"""你现在是 AxiomLabs 的 [{domain}] 逻辑专家。
+任务：根据当前状态，仅生成PDDL Problem的(:goal ...)部分。
+
+[领域逻辑规则]:
+{rules_str}
+
+[要求]:
+1. 仅输出 (:goal ...) 部分，不要输出完整的PDDL Problem。
+2. 如果当前状态已满足用户目标，请输出 "GOAL_FINISHED_ALREADY"。
+3. 避免使用exists关键字。
+4. 请你将此任务所有可能出现在goal中的目标，所有可能相关的目标全部写入objects
+5. 确保目标谓词与领域谓词匹配，并且参数类型正确。
+
+示例输出:
+(:goal (and (at file_a backup)))
+或
+GOAL_FINISHED_ALREADY
+"""
+        return {"first": first, "goal": goal}
 
     def _should_debug_prompt(self) -> bool:
         """检查是否应该打印调试信息"""
@@ -59,9 +117,13 @@ class PDDLTranslator(ITranslator):
             print(prompt, file=sys.stderr)
             print("=== DEBUG END ===\n", file=sys.stderr)
         
+        # 路由只是简单分类，使用轻量模型，并按最长领域名称限制输出长度
+        max_tokens = max((len(name.encode('utf-8')) for name in domain_names), default=0) + CONSTANTS.ROUTE_DOMAIN_EXTRA_TOKENS
         response = self.llm.chat(
             messages=[{"role": "user", "content": prompt}],
-            temperature=0
+            temperature=0,
+            model=self.config.llm_light_model,
+            max_tokens=max_tokens
         )
 
         choice = response.strip().lower()
@@ -82,14 +144,8 @@ class PDDLTranslator(ITranslator):
             # 默认返回空，后续可根据需要扩展
             return {}
         
-        # 类型映射：谓词 -> 参数位置 -> 类型
-        type_mapping = {
-            "at": {0: "file", 1: "folder"},
-            "connected": {0: "folder", 1: "folder"},
-            "scanned": {0: "folder"},
-            "is_created": {0: "file"},  # 也可能是folder，但默认为file
-            "is_compressed": {0: "file", 1: "archive"},
-        }
+        # 类型映射：谓词 -> 参数位置 -> 类型（共享常量，不再每次调用重建）
+        type_mapping = CONSTANTS.TYPE_MAPPING
         
         objects = {}
         for fact in memory_facts:
@@ -138,14 +194,8 @@ class PDDLTranslator(ITranslator):
         if domain != self.config.domain_name:
             return {}
         
-        # 类型映射：谓词 -> 参数位置 -> 类型
-        type_mapping = {
-            "at": {0: "file", 1: "folder"},
-            "connected": {0: "folder", 1: "folder"},
-            "scanned": {0: "folder"},
-            "is_created": {0: "file"},
-            "is_compressed": {0: "file", 1: "archive"},
-        }
+        # 类型映射：谓词 -> 参数位置 -> 类型（共享常量，不再每次调用重建）
+        type_mapping = CONSTANTS.TYPE_MAPPING
         
         objects = {}
         
@@ -318,6 +368,19 @@ class PDDLTranslator(ITranslator):
         # 排序以确保一致性
         return "\n    ".join(sorted(init_facts))
     
+    @staticmethod
+    def _is_response_complete(text: str) -> bool:
+        """
+        判断流式响应是否已包含可用结果：以完成标记开头，或已有一个闭合的代码块
+
+        完成标记只在响应开头时生效（与 translate 中的判断一致），
+        正文中提及该标记（如解释目标为何尚未完成）不会截断输出。
+
+        :param text: 已接收的响应文本
+        :return: 是否可以提前结束生成
+        """
+        return text.lstrip().startswith("GOAL_FINISHED_ALREADY") or text.count("```") >= 2
+
     def translate(self, user_goal: str, memory_facts: Set[str], domain: str, execution_history: List[str] = None, iteration: int = 0, objects: Dict[str, str] = None, base_init_facts: Set[str] = None) -> str:
         """
         将用户目标和当前事实转换为PDDL Problem
@@ -343,7 +406,7 @@ class PDDLTranslator(ITranslator):
         domain_content = self.storage.read_domain(domain)
 
         # 构建上下文
-        facts_str = "\n".join(sorted(list(memory_facts))) if memory_facts else "无"
+        facts_str = "\n".join(sorted(memory_facts)) if memory_facts else "无"
         
         # 构建执行历史字符串
         history_str = "无"
@@ -361,36 +424,18 @@ class PDDLTranslator(ITranslator):
 如果上述事实已经完全满足了用户最终目标（例如：对于移动任务，文件已在目标位置且不在原位置；对于删除任务，文件已不存在；对于创建任务，目标文件/文件夹已存在），
 请不要生成任何 PDDL，直接回复：GOAL_FINISHED_ALREADY"""
 
-        # 获取领域规则
-        rules_str = "\n".join([f"{i+1}. {rule}" for i, rule in enumerate(expert.get_rules())])
+        system_prompts = self._system_prompts.get(domain)
+        if system_prompts is None:
+            system_prompts = self._system_prompts[domain] = self._build_system_prompts(domain, expert)
 
         # 判断是否为第一轮
         if iteration == 0:
-            # 第一轮：使用完整Prompt
-            prompt = f"""你现在是[{domain}] 逻辑专家。
-任务：根据"已知环境事实"将用户目标转化为 PDDL Problem。
-
-{memory_context}
-
-[核心原则 - 严禁幻觉]:
-1. 你绝对不能将"已知环境事实"或任务中没有提到具体信息的目标写入init或goal中。
-2. 如果"已知环境事实"或任务中没有提到具体信息，你绝对不能猜测信息，优先将目标设置为可获取信息动作后的唯一谓词，且目标仅为此。
-3. 必须在 (:init) 中包含 (= (total-cost) 0)。
-4. 避免关键字：严禁出现exists
-5. 若已知环境事实为空（即显示为"无"），你必须将goal仅设置为获取信息的动作后的唯一谓词。
-6. 严禁发明任何文件对象。如果不知道具体文件名，绝对不能在goal中创建文件对象。
-
-- 执行历史记录了之前执行过的动作，可以帮助你理解当前状态
-- 结合已知事实和执行历史来判断目标是否已完成
-
-[领域逻辑规则]:
-{rules_str}
-
-[Domain 定义]:
+            # 第一轮：LLM生成完整Problem
+            system_prompt = system_prompts["first"]
+            prompt = f"""[Domain 定义]:
 {domain_content}
 
-[输出要求]:
-仅输出 PDDL 代码 或 GOAL_FINISHED_ALREADY。
+{memory_context}
 """
         else:
             # 后续轮次：自动构建objects和init，LLM只生成goal
@@ -406,8 +451,9 @@ class PDDLTranslator(ITranslator):
             objects_section = self._build_objects_section(objects)
             init_section = self._build_init_section(memory_facts, objects, base_init_facts)
             
-            prompt = f"""你现在是 AxiomLabs 的 [{domain}] 逻辑专家。
-任务：根据当前状态，仅生成PDDL Problem的(:goal ...)部分。
+            system_prompt = system_prompts["goal"]
+            prompt = f"""[Domain 定义]:
+{domain_content}
 
 [当前状态]:
 - 已知对象 (:objects):
@@ -417,36 +463,23 @@ class PDDLTranslator(ITranslator):
 
 {memory_context}
 
-[领域逻辑规则]:
-{rules_str}
-
-[Domain 定义]:
-{domain_content}
-
-[要求]:
-1. 仅输出 (:goal ...) 部分，不要输出完整的PDDL Problem。
-2. 如果当前状态已满足用户目标，请输出 "GOAL_FINISHED_ALREADY"。
-3. 避免使用exists关键字。
-4. 请你将此任务所有可能出现在goal中的目标，所有可能相关的目标全部写入objects
-5. 确保目标谓词与领域谓词匹配，并且参数类型正确。
-
-示例输出:
-(:goal (and (at file_a backup)))
-或
-GOAL_FINISHED_ALREADY
-
 请输出：
 """
         # 调试：打印prompt内容（仅当环境变量AXIOMLABS_DEBUG_PROMPT为真时）
         import sys
         if self._should_debug_prompt():
             print("\n=== DEBUG: Prompt content (before LLM) ===", file=sys.stderr)
+            print(system_prompt, file=sys.stderr)
             print(prompt, file=sys.stderr)
             print("=== DEBUG END ===\n", file=sys.stderr)
 
-        response = self.llm.chat(
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0
+        response = self.llm.chat_stream(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0,
+            stop_condition=self._is_response_complete
         )
 
         # 清理响应
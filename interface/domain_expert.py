@@ -1,6 +1,6 @@
 """领域专家接口定义"""
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Sequence
 
 
 class IDomainExpert(ABC):
@@ -13,7 +13,7 @@ class IDomainExpert(ABC):
         pass
 
     @abstractmethod
-    def get_rules(self) -> List[str]:
+    def get_rules(self) -> Sequence[str]:
         """
         获取领域规则列表
 
@@ -4,7 +4,7 @@ from typing import List
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """执行结果数据类"""
     success: bool
@@ -32,6 +32,36 @@ class IExecutor(ABC):
         """
         pass
 
+    def execute_batch(self, action_strs: List[str]) -> List[ExecutionResult]:
+        """
+        批量执行一组动作（如 setup_actions）
+
+        默认实现按顺序逐个执行，支持并发的执行器可以覆盖此方法。
+
+        :param action_strs: 动作字符串列表
+        :return: 与输入顺序一致的 ExecutionResult 列表
+        """
+        return [self.execute(action_str) for action_str in action_strs]
+
+    def rebind_paths(self, storage_path: str, skills_dir: str = None):
+        """
+        将执行器重新绑定到新的沙盒路径（跨训练轮次复用同一个执行器时调用）
+
+        默认实现不做任何处理，依赖沙盒路径的执行器可以覆盖此方法。
+
+        :param storage_path: 沙盒存储路径
+        :param skills_dir: 沙盒技能目录（可选）
+        """
+        pass
+
+    def unbind_sandbox_skills(self):
+        """
+        解除沙盒技能目录绑定，使执行器只提供核心技能
+
+        默认实现不做任何处理，会加载沙盒技能的执行器可以覆盖此方法。
+        """
+        pass
+
     @abstractmethod
     def get_execution_history(self) -> List[str]:
         """
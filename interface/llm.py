@@ -1,6 +1,6 @@
 """LLM接口定义"""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
 
 
 class ILLM(ABC):
@@ -11,7 +11,9 @@ class ILLM(ABC):
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0,
-        response_format: Dict[str, Any] = None
+        response_format: Dict[str, Any] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None
     ) -> str:
         """
         调用LLM进行对话
@@ -19,6 +21,38 @@ class ILLM(ABC):
         :param messages: 消息列表 [{"role": "user", "content": "..."}]
         :param temperature: 温度参数
         :param response_format: 响应格式（如 {'type': 'json_object'}）
+        :param model: 本次调用使用的模型，为None时使用客户端默认模型
+        :param max_tokens: 最大输出token数，为None时不限制
         :return: LLM响应内容
         """
         pass
+
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0,
+        response_format: Dict[str, Any] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        stop_condition: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """
+        以流式方式调用LLM，stop_condition 返回 True 时提前结束生成
+
+        参数与 chat() 保持一致；默认实现退化为一次性调用 chat()，支持流式输出的客户端可以覆盖此方法。
+
+        :param messages: 消息列表
+        :param temperature: 温度参数
+        :param response_format: 响应格式（如 {'type': 'json_object'}）
+        :param model: 本次调用使用的模型，为None时使用客户端默认模型
+        :param max_tokens: 最大输出token数，为None时不限制
+        :param stop_condition: 接收已累积文本的判定函数，返回 True 表示内容已完整
+        :return: LLM响应内容（提前结束时为已接收的部分）
+        """
+        return self.chat(
+            messages,
+            temperature=temperature,
+            response_format=response_format,
+            model=model,
+            max_tokens=max_tokens
+        )
@@ -12,8 +12,9 @@ import sys
 import json
 import logging
 import importlib
+import importlib.util
 import pkgutil
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.types import Tool
@@ -33,93 +34,127 @@ logger = logging.getLogger("AxiomLabs_mcp_server")
 # 创建服务器实例
 server = Server("AxiomLabs-skills")
 
+# 核心技能类缓存（核心目录在服务器进程生命周期内不变，只需扫描导入一次）
+_core_skill_classes_cache = None
+
+# 沙盒技能模块缓存：文件路径 -> ((mtime_ns, size), 模块)，文件未改动时不再重新执行
+_sandbox_module_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _discover_skill_classes(dir_type: str, skill_dir: str, base_cls) -> List[type]:
+    """
+    扫描目录并导入技能模块，返回其中所有技能类
+
+    :param dir_type: 目录类型（core/sandbox）
+    :param skill_dir: 技能目录
+    :param base_cls: 技能基类，用于类型检查
+    :return: 技能类列表
+    """
+    skill_classes = []
+    skill_module = "infrastructure.mcp_skills"
+
+    logger.info("扫描%s技能目录: %s", dir_type, skill_dir)
+
+    # 使用scandir扫描目录下的所有.py文件（按目录项过滤，无需逐个stat）
+    with os.scandir(skill_dir) as it:
+        filenames = [entry.name for entry in it if entry.is_file()]
+
+    for filename in filenames:
+        # 加载所有.py文件，除了mcp_base_skill.py
+        # 包括：1) 以_skill.py结尾的文件（核心技能） 2) generated_skill_v*.py文件（生成的技能）
+        if filename.endswith(".py") and filename != "mcp_base_skill.py":
+            # 检查是否是技能文件
+            is_core_skill = filename.endswith("_skill.py")
+            is_generated_skill = filename.startswith("generated_skill_")
+
+            if not (is_core_skill or is_generated_skill):
+                continue
+
+            module_name = filename[:-3]  # 移除.py
+            try:
+                # 动态导入模块
+                # 对于沙盒目录，需要特殊处理导入路径
+                if dir_type == "sandbox":
+                    # 将沙盒目录添加到 Python 路径
+                    if skill_dir not in sys.path:
+                        sys.path.insert(0, skill_dir)
+
+                    # 直接导入文件（沙盒技能可能被重写，按修改时间与大小判断是否需要重新执行）
+                    file_path = os.path.join(skill_dir, filename)
+                    st = os.stat(file_path)
+                    key = (st.st_mtime_ns, st.st_size)
+                    cached = _sandbox_module_cache.get(file_path)
+                    if cached is not None and cached[0] == key:
+                        module = cached[1]
+                    else:
+                        spec = importlib.util.spec_from_file_location(module_name, file_path)
+                        module = importlib.util.module_from_spec(spec)
+                        spec.loader.exec_module(module)
+                        _sandbox_module_cache[file_path] = (key, module)
+                else:
+                    # 核心技能使用标准导入（已导入的模块直接取自sys.modules）
+                    full_module_name = f"{skill_module}.{module_name}"
+                    module = sys.modules.get(full_module_name) or importlib.import_module(full_module_name)
+
+                # 查找模块中所有MCPBaseSkill的子类
+                for attr_name in dir(module):
+                    attr = getattr(module, attr_name)
+                    if isinstance(attr, type) and issubclass(attr, base_cls) and attr is not base_cls:
+                        skill_classes.append(attr)
+            except ImportError as e:
+                logger.error("导入模块 %s 失败: %s", filename, e)
+            except Exception as e:
+                logger.error("处理文件 %s 时出错: %s", filename, e)
+
+    return skill_classes
+
+
 # 动态加载MCP技能
 def load_mcp_skills():
     """
     动态加载多个目录下的MCP技能类
     
     扫描以下目录：
-    1. infrastructure/mcp_skills/ (核心技能)
+    1. infrastructure/mcp_skills/ (核心技能，首次扫描后缓存技能类)
     2. 环境变量 SANDBOX_MCP_SKILLS_DIR 指定的目录（沙盒技能）
     
     返回技能实例列表
     """
+    global _core_skill_classes_cache
     skills = []
-    skill_module = "infrastructure.mcp_skills"
-    
-    # 目录列表
-    skill_dirs = []
-    
-    # 1. 核心技能目录
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    core_skill_dir = os.path.join(current_dir, "infrastructure", "mcp_skills")
-    skill_dirs.append(("core", core_skill_dir))
-    
-    # 2. 沙盒技能目录（通过环境变量）
-    sandbox_skill_dir = os.environ.get("SANDBOX_MCP_SKILLS_DIR")
-    if sandbox_skill_dir and os.path.exists(sandbox_skill_dir):
-        skill_dirs.append(("sandbox", sandbox_skill_dir))
     
     # 导入MCPBaseSkill用于类型检查
     try:
         from infrastructure.mcp_skills.mcp_base_skill import MCPBaseSkill as Base
     except ImportError as e:
-        logger.error(f"无法导入MCPBaseSkill: {e}")
+        logger.error("无法导入MCPBaseSkill: %s", e)
         return skills
     
-    # 扫描每个目录
-    for dir_type, skill_dir in skill_dirs:
-        if not os.path.exists(skill_dir):
-            logger.debug(f"技能目录不存在 ({dir_type}): {skill_dir}")
-            continue
-        
-        logger.info(f"扫描{dir_type}技能目录: {skill_dir}")
-        
-        # 扫描目录下的所有.py文件
-        for filename in os.listdir(skill_dir):
-            # 加载所有.py文件，除了mcp_base_skill.py
-            # 包括：1) 以_skill.py结尾的文件（核心技能） 2) generated_skill_v*.py文件（生成的技能）
-            if filename.endswith(".py") and filename != "mcp_base_skill.py":
-                # 检查是否是技能文件
-                is_core_skill = filename.endswith("_skill.py")
-                is_generated_skill = filename.startswith("generated_skill_")
-                
-                if not (is_core_skill or is_generated_skill):
-                    continue
-                    
-                module_name = filename[:-3]  # 移除.py
-                try:
-                    # 动态导入模块
-                    # 对于沙盒目录，需要特殊处理导入路径
-                    if dir_type == "sandbox":
-                        # 将沙盒目录添加到 Python 路径
-                        import sys
-                        if skill_dir not in sys.path:
-                            sys.path.insert(0, skill_dir)
-                        
-                        # 直接导入文件
-                        spec = importlib.util.spec_from_file_location(module_name, os.path.join(skill_dir, filename))
-                        module = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(module)
-                    else:
-                        # 核心技能使用标准导入
-                        full_module_name = f"{skill_module}.{module_name}"
-                        module = importlib.import_module(full_module_name)
-                    
-                    # 查找模块中所有MCPBaseSkill的子类
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if isinstance(attr, type) and issubclass(attr, Base) and attr is not Base:
-                            try:
-                                skill_instance = attr()
-                                skills.append(skill_instance)
-                                logger.info(f"加载MCP技能 ({dir_type}): {skill_instance.name}")
-                            except Exception as e:
-                                logger.error(f"实例化技能 {attr_name} 失败: {e}")
-                except ImportError as e:
-                    logger.error(f"导入模块 {filename} 失败: {e}")
-                except Exception as e:
-                    logger.error(f"处理文件 {filename} 时出错: {e}")
+    # 1. 核心技能目录
+    skill_classes = []
+    if _core_skill_classes_cache is None:
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        core_skill_dir = os.path.join(current_dir, "infrastructure", "mcp_skills")
+        if os.path.isdir(core_skill_dir):
+            _core_skill_classes_cache = _discover_skill_classes("core", core_skill_dir, Base)
+        else:
+            logger.debug("技能目录不存在 (core): %s", core_skill_dir)
+    skill_classes.extend(("core", cls) for cls in _core_skill_classes_cache or [])
+    
+    # 2. 沙盒技能目录（通过环境变量）
+    sandbox_skill_dir = os.environ.get("SANDBOX_MCP_SKILLS_DIR")
+    if sandbox_skill_dir and os.path.isdir(sandbox_skill_dir):
+        skill_classes.extend(
+            ("sandbox", cls) for cls in _discover_skill_classes("sandbox", sandbox_skill_dir, Base)
+        )
+    
+    for dir_type, skill_cls in skill_classes:
+        try:
+            skill_instance = skill_cls()
+            skills.append(skill_instance)
+            logger.info("加载MCP技能 (%s): %s", dir_type, skill_instance.name)
+        except Exception as e:
+            logger.error("实例化技能 %s 失败: %s", skill_cls.__name__, e)
     
     # 如果动态加载失败，回退到硬编码列表
     if not skills:
@@ -143,7 +178,7 @@ def load_mcp_skills():
         if skill.name not in unique_skills:
             unique_skills[skill.name] = skill
         else:
-            logger.warning(f"重复技能名称: {skill.name}，跳过")
+            logger.warning("重复技能名称: %s，跳过", skill.name)
     
     return list(unique_skills.values())
 
@@ -165,7 +200,7 @@ def _reload_skills_if_needed():
         _last_sandbox_dir = current_sandbox_dir
         _skill_instances_cache = load_mcp_skills()
         _skill_map_cache = {skill.name: skill for skill in _skill_instances_cache}
-        logger.info(f"技能重新加载完成，共 {len(_skill_instances_cache)} 个技能")
+        logger.info("技能重新加载完成，共 %s 个技能", len(_skill_instances_cache))
         return True
     return False
 
@@ -187,7 +222,7 @@ async def handle_list_tools() -> list:
                 inputSchema=skill.input_schema
             )
         )
-    logger.info(f"列出工具: {[tool.name for tool in tools]}")
+    logger.info("列出工具: %s", [tool.name for tool in tools])
     return tools
 
 @server.call_tool()
@@ -244,10 +279,10 @@ async def main():
     sandbox_storage_path = os.environ.get("SANDBOX_STORAGE_PATH")
     sandbox_skills_dir = os.environ.get("SANDBOX_MCP_SKILLS_DIR")
     
-    logger.info(f"MCP服务器启动 - 环境变量检查:")
-    logger.info(f"  SANDBOX_STORAGE_PATH: {sandbox_storage_path}")
-    logger.info(f"  SANDBOX_MCP_SKILLS_DIR: {sandbox_skills_dir}")
-    logger.info(f"  当前工作目录: {os.getcwd()}")
+    logger.info("MCP服务器启动 - 环境变量检查:")
+    logger.info("  SANDBOX_STORAGE_PATH: %s", sandbox_storage_path)
+    logger.info("  SANDBOX_MCP_SKILLS_DIR: %s", sandbox_skills_dir)
+    logger.info("  当前工作目录: %s", os.getcwd())
     
     # 检查是否为沙盒模式，如果是则改变工作目录到沙盒存储路径
     target_working_dir = None
@@ -255,7 +290,7 @@ async def main():
     # 优先使用SANDBOX_STORAGE_PATH
     if sandbox_storage_path and os.path.exists(sandbox_storage_path):
         target_working_dir = sandbox_storage_path
-        logger.info(f"使用沙盒存储路径作为工作目录: {target_working_dir}")
+        logger.info("使用沙盒存储路径作为工作目录: %s", target_working_dir)
     else:
         # 生产模式：尝试使用默认的workspace目录
         # 检查当前工作目录下是否有workspace目录
@@ -263,7 +298,7 @@ async def main():
         workspace_dir = os.path.join(current_cwd, "workspace")
         if os.path.exists(workspace_dir):
             target_working_dir = workspace_dir
-            logger.info(f"使用默认workspace目录作为工作目录: {target_working_dir}")
+            logger.info("使用默认workspace目录作为工作目录: %s", target_working_dir)
         else:
             # 如果当前目录没有workspace，尝试在项目根目录下查找
             # 假设MCP服务器是从项目根目录运行的
@@ -271,7 +306,7 @@ async def main():
             workspace_dir = os.path.join(project_root, "workspace")
             if os.path.exists(workspace_dir):
                 target_working_dir = workspace_dir
-                logger.info(f"使用项目根目录下的workspace目录作为工作目录: {target_working_dir}")
+                logger.info("使用项目根目录下的workspace目录作为工作目录: %s", target_working_dir)
             else:
                 logger.info("未找到workspace目录，保持原工作目录")
     
@@ -280,10 +315,10 @@ async def main():
         original_cwd = os.getcwd()
         try:
             os.chdir(target_working_dir)
-            logger.info(f"切换到工作目录: {target_working_dir}")
-            logger.info(f"当前工作目录: {os.getcwd()}")
+            logger.info("切换到工作目录: %s", target_working_dir)
+            logger.info("当前工作目录: %s", os.getcwd())
         except Exception as e:
-            logger.error(f"切换工作目录失败: {e}")
+            logger.error("切换工作目录失败: %s", e)
     
     # 使用stdio传输
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
@@ -0,0 +1,37 @@
+"""fast_json 的缩进格式与标准库 json 保持一致"""
+import json
+import os
+import tempfile
+import unittest
+
+from utils import fast_json
+
+
+class FastJsonIndentTest(unittest.TestCase):
+
+    data = {"name": "文件", "items": [1, {"a": None}]}
+
+    def test_dumps_defaults_to_two_spaces(self):
+        self.assertEqual(fast_json.dumps(self.data), json.dumps(self.data, indent=2, ensure_ascii=False))
+
+    def test_dumps_honours_indent(self):
+        self.assertEqual(fast_json.dumps(self.data, indent=4), json.dumps(self.data, indent=4, ensure_ascii=False))
+
+    def test_dump_file_defaults_to_four_spaces(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.json")
+            fast_json.dump_file(self.data, path)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), json.dumps(self.data, indent=4, ensure_ascii=False))
+            self.assertEqual(fast_json.load_file(path), self.data)
+
+    def test_dump_file_two_spaces_round_trips(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.json")
+            fast_json.dump_file(self.data, path, indent=2)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), json.dumps(self.data, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""流式LLM调用：提前结束判定、接口默认实现与流关闭"""
+import importlib.util
+import unittest
+from types import SimpleNamespace
+
+from interface.llm import ILLM
+from infrastructure.translator.pddl_translator import PDDLTranslator
+
+
+class ResponseCompleteTest(unittest.TestCase):
+    """PDDLTranslator._is_response_complete 的提前结束条件"""
+
+    is_complete = staticmethod(PDDLTranslator._is_response_complete)
+
+    def test_sentinel_at_start(self):
+        self.assertTrue(self.is_complete("GOAL_FINISHED_ALREADY"))
+        self.assertTrue(self.is_complete("\n  GOAL_FINISHED_ALREADY"))
+
+    def test_sentinel_inside_explanation_does_not_stop(self):
+        self.assertFalse(self.is_complete("目标尚未完成，因此不能输出 GOAL_FINISHED_ALREADY，"))
+
+    def test_partial_sentinel_does_not_stop(self):
+        self.assertFalse(self.is_complete("GOAL_FINISHED"))
+
+    def test_stops_after_closed_code_block(self):
+        self.assertFalse(self.is_complete("```pddl\n(:goal (and (at a b))"))
+        self.assertTrue(self.is_complete("```pddl\n(:goal (and (at a b)))\n```"))
+
+
+class RecordingLLM(ILLM):
+    """只实现 chat() 的 LLM，用于验证 chat_stream 默认实现"""
+
+    def __init__(self):
+        self.calls = []
+
+    def chat(self, messages, temperature=0, response_format=None, model=None, max_tokens=None):
+        self.calls.append((messages, temperature, response_format, model, max_tokens))
+        return "done"
+
+
+class DefaultChatStreamTest(unittest.TestCase):
+
+    def test_forwards_all_chat_parameters(self):
+        llm = RecordingLLM()
+        messages = [{"role": "user", "content": "hi"}]
+
+        result = llm.chat_stream(
+            messages,
+            temperature=0.5,
+            response_format={"type": "json_object"},
+            model="light",
+            max_tokens=16,
+            stop_condition=lambda text: True,
+        )
+
+        self.assertEqual(result, "done")
+        self.assertEqual(llm.calls, [(messages, 0.5, {"type": "json_object"}, "light", 16)])
+
+
+class FakeStream:
+    """按块产出内容并记录是否被关闭的流"""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for piece in self.pieces:
+            self.consumed += 1
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+    def close(self):
+        self.closed = True
+
+
+@unittest.skipUnless(importlib.util.find_spec("openai"), "openai 未安装")
+class DeepSeekChatStreamTest(unittest.TestCase):
+
+    def _client(self, stream):
+        from infrastructure.llm.deepseek_client import DeepSeekClient
+
+        client = DeepSeekClient(api_key="test", base_url="http://localhost", model="main")
+        self.create_kwargs = {}
+
+        def create(**kwargs):
+            self.create_kwargs = kwargs
+            return stream
+
+        client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        return client
+
+    def test_stops_early_and_closes_stream(self):
+        stream = FakeStream(["```pddl\n", "(:goal (at a b))\n", "```", " trailing", " more"])
+        client = self._client(stream)
+
+        text = client.chat_stream([], stop_condition=PDDLTranslator._is_response_complete)
+
+        self.assertEqual(text, "```pddl\n(:goal (at a b))\n```")
+        self.assertEqual(stream.consumed, 3)
+        self.assertTrue(stream.closed)
+
+    def test_closes_stream_when_fully_consumed(self):
+        stream = FakeStream(["a", "b"])
+        client = self._client(stream)
+
+        self.assertEqual(client.chat_stream([], model="light", max_tokens=8), "ab")
+        self.assertTrue(stream.closed)
+        self.assertEqual(self.create_kwargs["model"], "light")
+        self.assertEqual(self.create_kwargs["max_tokens"], 8)
+        self.assertTrue(self.create_kwargs["stream"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""MCP 执行器批量执行：顺序、执行历史与错误路径"""
+import unittest
+from unittest import mock
+
+import infrastructure.executor.mcp_executor as mcp_executor
+from infrastructure.mcp_client import MCPResponse
+
+
+class FakeMCPClient:
+    """记录调用顺序的 MCP 客户端替身"""
+
+    def __init__(self, connect_ok=True, fail_tools=(), raise_tools=()):
+        self.connect_ok = connect_ok
+        self.fail_tools = set(fail_tools)
+        self.raise_tools = set(raise_tools)
+        self.calls = []
+
+    def connect(self):
+        return self.connect_ok
+
+    def get_tool_names(self):
+        return ["scan", "move", "get_admin", "remove_file"]
+
+    def call_tool(self, tool_name, arguments):
+        self.calls.append((tool_name, arguments))
+        if tool_name in self.raise_tools:
+            raise RuntimeError("server gone")
+        if tool_name in self.fail_tools:
+            return MCPResponse(success=False, message="", error="denied")
+        return MCPResponse(success=True, message="ok", pddl_delta="(at a b)")
+
+    def disconnect(self):
+        pass
+
+
+class ExecuteBatchTest(unittest.TestCase):
+
+    def _executor(self, client):
+        with mock.patch.object(mcp_executor, "SimpleMCPClient"):
+            executor = mcp_executor.MCPActionExecutorRefactored()
+        executor.client = client
+        return executor
+
+    def test_actions_run_in_input_order(self):
+        client = FakeMCPClient()
+        executor = self._executor(client)
+        actions = ["scan root", "move file_a root docs", "get_admin", "remove_file file_a docs"]
+
+        results = executor.execute_batch(actions)
+
+        self.assertEqual([name for name, _ in client.calls], ["scan", "move", "get_admin", "remove_file"])
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual(executor.get_execution_history(), ["scan", "move", "get_admin", "remove_file"])
+
+    def test_argument_less_action_keeps_its_position(self):
+        client = FakeMCPClient()
+        executor = self._executor(client)
+
+        executor.execute_batch(["move file_a root docs", "get_admin", "move file_a docs root"])
+
+        self.assertEqual(
+            client.calls,
+            [
+                ("move", {"file_name": "file_a", "from_folder": "root", "to_folder": "docs"}),
+                ("get_admin", {}),
+                ("move", {"file_name": "file_a", "from_folder": "docs", "to_folder": "root"}),
+            ],
+        )
+
+    def test_connect_failure_records_no_history(self):
+        client = FakeMCPClient(connect_ok=False)
+        executor = self._executor(client)
+
+        results = executor.execute_batch(["scan root", "get_admin"])
+
+        self.assertEqual(len(results), 2)
+        self.assertFalse(any(r.success for r in results))
+        self.assertEqual(client.calls, [])
+        self.assertEqual(executor.get_execution_history(), [])
+
+    def test_failures_do_not_stop_later_actions(self):
+        client = FakeMCPClient(fail_tools={"move"}, raise_tools={"get_admin"})
+        executor = self._executor(client)
+
+        results = executor.execute_batch(["move file_a root docs", "get_admin", "move onlyone", "scan root"])
+
+        self.assertEqual([r.success for r in results], [False, False, False, True])
+        self.assertIn("denied", results[0].message)
+        self.assertIn("server gone", results[1].message)
+        self.assertIn("动作解析失败", results[2].message)
+        # 解析失败的动作不会发出调用
+        self.assertEqual([name for name, _ in client.calls], ["move", "get_admin", "scan"])
+
+    def test_unknown_tool_is_rejected_locally(self):
+        client = FakeMCPClient()
+        executor = self._executor(client)
+
+        result = executor.execute("bogus x")
+
+        self.assertFalse(result.success)
+        self.assertIn("bogus", result.message)
+        self.assertEqual(client.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
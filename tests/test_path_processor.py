@@ -0,0 +1,85 @@
+"""PathProcessor 的基础路径安全检查与相对路径计算随配置变化"""
+import os
+import tempfile
+import unittest
+
+from infrastructure.skills.path_processor import PathConfig, PathProcessor
+
+
+class PathProcessorTestCase(unittest.TestCase):
+    """在临时目录下准备两个基础路径"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.realpath(self._tmp.name)
+        self.base = os.path.join(self.root, "storage")
+        self.other = os.path.join(self.root, "sandbox")
+        os.makedirs(self.base)
+        os.makedirs(self.other)
+        self.processor = PathProcessor(PathConfig(base_path=self.base))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+
+class PathSafetyTest(PathProcessorTestCase):
+
+    def test_base_and_children_are_safe(self):
+        self.assertTrue(self.processor._is_path_safe(self.base))
+        self.assertTrue(self.processor._is_path_safe(os.path.join(self.base, "docs", "a.txt")))
+
+    def test_sibling_with_common_prefix_is_rejected(self):
+        self.assertFalse(self.processor._is_path_safe(self.base + "2"))
+        self.assertFalse(self.processor._is_path_safe(os.path.join(self.base, "..", "storage2")))
+
+    def test_update_base_path(self):
+        self.processor.update_base_path(self.other)
+        self.assertTrue(self.processor._is_path_safe(os.path.join(self.other, "a.txt")))
+        self.assertFalse(self.processor._is_path_safe(os.path.join(self.base, "a.txt")))
+
+    def test_direct_config_change_is_honoured(self):
+        self.processor.config.base_path = self.other
+        self.assertTrue(self.processor._is_path_safe(os.path.join(self.other, "a.txt")))
+        self.assertFalse(self.processor._is_path_safe(os.path.join(self.base, "a.txt")))
+
+    def test_relative_base_follows_working_directory(self):
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.base)
+            processor = PathProcessor(PathConfig(base_path="."))
+            os.chdir(self.other)
+            self.assertTrue(processor._is_path_safe(os.path.join(self.other, "a.txt")))
+            self.assertFalse(processor._is_path_safe(os.path.join(self.base, "a.txt")))
+        finally:
+            os.chdir(cwd)
+
+
+class RelativePathTest(PathProcessorTestCase):
+    """get_relative_path 的前缀截取与 os.path.relpath 结果一致"""
+
+    def _assert_matches_relpath(self, path):
+        expected = os.path.relpath(path, self.processor.config.base_path)
+        self.assertEqual(self.processor.get_relative_path(path), "" if expected == "." else expected)
+
+    def test_matches_relpath(self):
+        for path in (
+            self.base,
+            self.base + os.sep,
+            os.path.join(self.base, "docs"),
+            os.path.join(self.base, "docs", "..", "a.txt"),
+            self.base + "2",
+            self.other,
+        ):
+            self._assert_matches_relpath(path)
+
+    def test_follows_base_change(self):
+        target = os.path.join(self.other, "docs", "a.txt")
+        self.processor.config.base_path = self.other
+        self.assertEqual(self.processor.get_relative_path(target), os.path.join("docs", "a.txt"))
+
+        self.processor.update_base_path(self.base)
+        self._assert_matches_relpath(target)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""PDDL Domain 语法树解析、缓存与 PDDLModifier 的增删"""
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from infrastructure.pddl import pddl_ast
+from infrastructure.pddl.pddl_ast import PDDLParseError, load_domain, parse_domain, parse_forms
+from infrastructure.pddl.pddl_modifier import PDDLModifier
+
+DOMAIN = """(define (domain file-manager)
+  (:requirements :strips :typing) ; 注释里的 (:action fake) 不会被解析
+  (:types file folder)
+  (:predicates
+    (at ?f - file ?d - folder)
+    (scanned ?d - folder)
+  )
+
+  (:action scan
+    :parameters (?d - folder)
+    :effect (and (scanned ?d))
+  )
+
+  (:action move
+    :parameters (?f - file ?src - folder ?dst - folder)
+    :precondition (and (at ?f ?src))
+    :effect (and (at ?f ?dst) (not (at ?f ?src)))
+  )
+)
+"""
+
+REMOVE_ACTION = """(:action remove_file
+    :parameters (?f - file ?d - folder)
+    :precondition (and (at ?f ?d))
+    :effect (and (not (at ?f ?d)))
+  )"""
+
+
+class ParseDomainTest(unittest.TestCase):
+
+    def test_parses_header_and_actions(self):
+        domain = parse_domain(DOMAIN)
+
+        self.assertEqual(domain.name, "file-manager")
+        self.assertEqual(domain.requirements, (":strips", ":typing"))
+        self.assertEqual(domain.types, ("file", "folder"))
+        self.assertEqual(domain.action_names, ["scan", "move"])
+        move = domain.get_action("move")
+        self.assertEqual(move.parameters, ("?f", "-", "file", "?src", "-", "folder", "?dst", "-", "folder"))
+        self.assertEqual(move.precondition, ("and", ("at", "?f", "?src")))
+        self.assertTrue(DOMAIN[slice(*move.span)].startswith("(:action move"))
+        self.assertIsNone(domain.get_action("fake"))
+
+    def test_unbalanced_input_raises(self):
+        with self.assertRaises(PDDLParseError):
+            parse_domain(DOMAIN.rstrip()[:-1])
+        with self.assertRaises(PDDLParseError):
+            parse_forms("(:action a))")
+        with self.assertRaises(PDDLParseError):
+            parse_domain("(domain x)")
+
+    def test_with_and_without_action_round_trip(self):
+        domain = parse_domain(DOMAIN)
+
+        added = parse_domain(domain.with_action(REMOVE_ACTION, ";; AI"))
+        self.assertEqual(added.action_names, ["scan", "move", "remove_file"])
+        self.assertIn(";; AI\n(:action remove_file", added.source)
+
+        removed = parse_domain(added.without_action("remove_file"))
+        self.assertEqual(removed.action_names, ["scan", "move"])
+        self.assertIsNone(domain.without_action("missing"))
+
+
+class DomainFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "domain.pddl")
+        self._write(DOMAIN)
+        self.modifier = PDDLModifier(config=SimpleNamespace(pddl_ai_generated_comment=";; AI"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, text):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_same_size_same_mtime_rewrite_is_reloaded(self):
+        st = os.stat(self.path)
+        self.assertEqual(load_domain(self.path).action_names, ["scan", "move"])
+
+        # 等长内容、相同 mtime：按内容缓存时仍能读到新版本
+        self._write(DOMAIN.replace("(:action scan", "(:action scam"))
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        self.assertEqual(load_domain(self.path).action_names, ["scam", "move"])
+
+    def test_unchanged_file_reuses_parse(self):
+        self.assertIs(load_domain(self.path), load_domain(self.path))
+
+    def test_add_and_remove_action(self):
+        self.assertTrue(self.modifier.add_action(self.path, REMOVE_ACTION))
+        self.assertTrue(self.modifier.action_exists(self.path, "remove_file"))
+        self.assertEqual(load_domain(self.path).action_names, ["scan", "move", "remove_file"])
+
+        self.assertTrue(self.modifier.remove_action(self.path, "remove_file"))
+        self.assertFalse(self.modifier.action_exists(self.path, "remove_file"))
+        self.assertEqual(load_domain(self.path).action_names, ["scan", "move"])
+
+    def test_add_existing_action_is_noop(self):
+        self.assertTrue(self.modifier.add_action(self.path, "(:action scan :parameters () :effect (and))"))
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), DOMAIN)
+
+    def test_add_rejects_unbalanced_action(self):
+        self.assertFalse(self.modifier.add_action(self.path, "(:action broken :parameters ("))
+        self.assertEqual(load_domain(self.path).action_names, ["scan", "move"])
+
+    def test_remove_missing_action_fails(self):
+        self.assertFalse(self.modifier.remove_action(self.path, "missing"))
+
+    def test_writes_clear_the_cache(self):
+        load_domain(self.path)
+        self.modifier.add_action(self.path, REMOVE_ACTION)
+        self.assertEqual(pddl_ast._parse_domain_cached.cache_info().currsize, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""回归测试通过记录缓存的键与持久化"""
+import json
+import os
+import tempfile
+import unittest
+
+from algorithm.regression import RegressionAlgorithm
+
+
+class RegressionCacheKeyTest(unittest.TestCase):
+    """_context_key / _case_key / _environment_digest 的失效条件"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.skills_dir = os.path.join(self.root, "mcp_skills")
+        os.makedirs(self.skills_dir)
+        self._write(os.path.join(self.skills_dir, "scan_skill.py"), "print('scan')\n")
+        self.server_script = os.path.join(self.root, "server.py")
+        self._write(self.server_script, "server = 1\n")
+        self.algorithm = RegressionAlgorithm(
+            registry_path=os.path.join(self.root, "regression_registry.json"),
+            environment_paths=[self.skills_dir, self.server_script],
+        )
+        self.test_case = {"goal": "(at file_a folder_x)", "setup_actions": [["create_folder", "folder_x"]]}
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    @staticmethod
+    def _write(path, text):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def _key(self, skill=b"skill", domain=b"domain", test_case=None):
+        context = RegressionAlgorithm._context_key(skill, domain, self.algorithm._environment_digest())
+        return RegressionAlgorithm._case_key(context, test_case or self.test_case)
+
+    def test_same_inputs_give_same_key(self):
+        self.assertEqual(self._key(), self._key())
+
+    def test_candidate_and_case_changes_invalidate(self):
+        base = self._key()
+        self.assertNotEqual(base, self._key(skill=b"skill2"))
+        self.assertNotEqual(base, self._key(domain=b"domain2"))
+        self.assertNotEqual(base, self._key(test_case={**self.test_case, "goal": "(at file_b folder_x)"}))
+
+    def test_field_boundaries_are_unambiguous(self):
+        self.assertNotEqual(self._key(skill=b"ab", domain=b"c"), self._key(skill=b"a", domain=b"bc"))
+
+    def test_core_skill_change_invalidates(self):
+        base = self._key()
+        self._write(os.path.join(self.skills_dir, "scan_skill.py"), "print('scan v2')\n")
+        self.assertNotEqual(base, self._key())
+
+    def test_added_core_skill_invalidates(self):
+        base = self._key()
+        self._write(os.path.join(self.skills_dir, "move_skill.py"), "print('move')\n")
+        self.assertNotEqual(base, self._key())
+
+    def test_server_change_invalidates(self):
+        base = self._key()
+        self._write(self.server_script, "server = 2\n")
+        self.assertNotEqual(base, self._key())
+
+    def test_pycache_is_ignored(self):
+        base = self._key()
+        os.makedirs(os.path.join(self.skills_dir, "__pycache__"))
+        self._write(os.path.join(self.skills_dir, "__pycache__", "scan_skill.cpython-311.pyc"), "x")
+        self.assertEqual(base, self._key())
+
+
+class RegressionPassCacheTest(unittest.TestCase):
+    """通过记录按上下文裁剪并原子写入"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self._tmp.name, "regression_cache.json")
+        self.algorithm = RegressionAlgorithm(
+            registry_path=os.path.join(self._tmp.name, "regression_registry.json"),
+            cache_path=self.cache_path,
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trip_for_same_context(self):
+        self.algorithm._save_pass_cache("ctx-a", {"case-1": "goal-1"})
+        self.assertEqual(self.algorithm._load_pass_cache("ctx-a"), {"case-1": "goal-1"})
+
+    def test_other_context_is_dropped(self):
+        self.algorithm._save_pass_cache("ctx-a", {"case-1": "goal-1"})
+        self.assertEqual(self.algorithm._load_pass_cache("ctx-b"), {})
+
+        self.algorithm._save_pass_cache("ctx-b", {"case-2": "goal-2"})
+        with open(self.cache_path, encoding="utf-8") as f:
+            stored = json.load(f)
+        self.assertEqual(stored, {"context": "ctx-b", "passed": {"case-2": "goal-2"}})
+
+    def test_legacy_flat_cache_is_ignored(self):
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump({"case-1": "goal-1"}, f)
+        self.assertEqual(self.algorithm._load_pass_cache("ctx-a"), {})
+
+    def test_save_leaves_no_temp_file(self):
+        self.algorithm._save_pass_cache("ctx-a", {"case-1": "goal-1"})
+        self.assertEqual(os.listdir(self._tmp.name), ["regression_cache.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""沙盒文件复制：reflink 失败时的回退与禁用条件"""
+import errno
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from infrastructure.sandbox import sandbox_manager
+
+
+class CloneFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self._tmp.name, "src.txt")
+        self.dst = os.path.join(self._tmp.name, "dst.txt")
+        with open(self.src, "w", encoding="utf-8") as f:
+            f.write("data")
+        patcher = mock.patch.object(sandbox_manager, "_reflink_supported", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _clone_with_ioctl_error(self, code):
+        fake_fcntl = mock.Mock()
+        fake_fcntl.ioctl.side_effect = OSError(code, os.strerror(code))
+        with mock.patch.object(sandbox_manager, "fcntl", fake_fcntl):
+            result = sandbox_manager._clone_file(self.src, self.dst)
+        self.assertEqual(result, self.dst)
+        with open(self.dst, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "data")
+
+    def test_unsupported_filesystem_disables_reflink(self):
+        for code in (errno.EOPNOTSUPP, errno.EINVAL, errno.ENOTTY):
+            with self.subTest(errno=code):
+                sandbox_manager._reflink_supported = True
+                self._clone_with_ioctl_error(code)
+                self.assertFalse(sandbox_manager._reflink_supported)
+
+    def test_other_errors_fall_back_for_this_file_only(self):
+        for code in (errno.EXDEV, errno.ENOSPC, errno.EIO):
+            with self.subTest(errno=code):
+                self._clone_with_ioctl_error(code)
+                self.assertTrue(sandbox_manager._reflink_supported)
+
+
+if __name__ == "__main__":
+    unittest.main()
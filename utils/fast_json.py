@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+JSON 读写工具
+优先使用 orjson（C/Rust 实现，解析与序列化更快），未安装时回退到标准库 json
+orjson 只支持 2 空格缩进，其他缩进宽度的序列化一律走标准库 json
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data) -> Any:
+    """
+    解析 JSON 文本
+
+    :param data: JSON 字符串或字节串
+    :return: 解析结果
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: int = 2) -> str:
+    """
+    将对象序列化为缩进格式的 JSON 字符串（非 ASCII 字符不转义）
+
+    :param obj: 要序列化的对象
+    :param indent: 缩进空格数
+    :return: JSON 字符串
+    """
+    if orjson is not None and indent == 2:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, indent=indent, ensure_ascii=False)
+
+
+def load_file(path: str) -> Any:
+    """
+    读取并解析 JSON 文件
+
+    :param path: 文件路径
+    :return: 解析结果
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_file(obj: Any, path: str, indent: int = 4):
+    """
+    将对象以缩进格式写入 JSON 文件（非 ASCII 字符不转义）
+
+    :param obj: 要写入的对象
+    :param path: 文件路径
+    :param indent: 缩进空格数，默认与项目中已有 JSON 文件保持一致（4 空格）
+    """
+    if orjson is not None and indent == 2:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=indent, ensure_ascii=False)
@@ -0,0 +1,23 @@
+"""入口脚本共用的日志配置"""
+import logging
+import os
+import sys
+
+
+def setup_logging():
+    """
+    统一配置日志输出（各入口脚本在加载配置后调用一次）
+
+    AxiomLabs_* 日志以 INFO 级别输出到标准输出。
+    回归测试逐用例的日志级别可通过 REGRESSION_LOG_LEVEL 调整（默认 INFO，
+    设为 WARNING 时只保留失败与异常），需在 .env 加载之后读取才能生效。
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(message)s',
+        stream=sys.stdout
+    )
+    level = logging.getLevelName(os.getenv("REGRESSION_LOG_LEVEL", "INFO").strip().upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+    logging.getLogger("AxiomLabs_regression").setLevel(level)